@@ -8,15 +8,24 @@ import pyrin.admin.services as admin_services
 from pyrin.api.router.decorators import api, post, patch, delete
 
 
-admin_config = admin_services.get_admin_configurations()
-url = admin_services.get_admin_base_url()
-admin_config.update(swagger=False)
-admin_config.pop('paged', None)
-admin_config.pop('readable', None)
-admin_config.pop('url', None)
-is_enabled = admin_config.pop('enabled', False)
-
-if is_enabled is True:
+def register_routes():
+    """
+    registers admin api routes if admin api is enabled.
+
+    it will be called after application has been initialized. so the admin
+    configurations will not be loaded when application starts in scripting mode.
+    """
+
+    admin_config = admin_services.get_admin_configurations()
+    url = admin_services.get_admin_base_url()
+    admin_config.update(swagger=False)
+    admin_config.pop('paged', None)
+    admin_config.pop('readable', None)
+    admin_config.pop('url', None)
+    is_enabled = admin_config.pop('enabled', False)
+    if is_enabled is not True:
+        return
+
     @api(f'{url}<register_name>/<pk>', **admin_config)
     def get(register_name, pk, **options):
         """
@@ -33,7 +42,6 @@ if is_enabled is True:
 
         return admin_services.get(register_name, pk)
 
-
     @api(f'{url}<register_name>', **admin_config)
     def find(register_name, **filters):
         """
@@ -48,7 +56,6 @@ if is_enabled is True:
 
         return admin_services.find(register_name, **filters)
 
-
     @post(f'{url}<register_name>', **admin_config)
     def create(register_name, **data):
         """
@@ -65,7 +72,6 @@ if is_enabled is True:
 
         return admin_services.create(register_name, **data)
 
-
     @patch(f'{url}<register_name>/<pk>', **admin_config)
     def update(register_name, pk, **data):
         """
@@ -82,7 +88,6 @@ if is_enabled is True:
 
         return admin_services.update(register_name, pk, **data)
 
-
     @delete(f'{url}<register_name>/<pk>', **admin_config)
     def remove(register_name, pk, **options):
         """
@@ -96,7 +101,6 @@ if is_enabled is True:
 
         return admin_services.remove(register_name, pk)
 
-
     @delete(f'{url}<register_name>/bulk', **admin_config)
     def remove_bulk(register_name, pk):
         """
@@ -110,7 +114,6 @@ if is_enabled is True:
 
         return admin_services.remove_bulk(register_name, pk)
 
-
     @delete(f'{url}<register_name>', **admin_config)
     def remove_all(register_name):
         """
@@ -123,7 +126,6 @@ if is_enabled is True:
 
         return admin_services.remove_all(register_name)
 
-
     @api(f'{url}metadata', **admin_config)
     def get_main_metadata(**options):
         """
@@ -138,7 +140,6 @@ if is_enabled is True:
 
         return admin_services.get_main_metadata()
 
-
     @api(f'{url}metadata/<register_name>/find', **admin_config)
     def get_find_metadata(register_name, **options):
         """
@@ -151,7 +152,6 @@ if is_enabled is True:
 
         return admin_services.get_find_metadata(register_name)
 
-
     @api(f'{url}metadata/<register_name>/create', **admin_config)
     def get_create_metadata(register_name, **options):
         """
@@ -164,7 +164,6 @@ if is_enabled is True:
 
         return admin_services.get_create_metadata(register_name)
 
-
     @api(f'{url}metadata/<register_name>/update', **admin_config)
     def get_update_metadata(register_name, **options):
         """
@@ -177,7 +176,6 @@ if is_enabled is True:
 
         return admin_services.get_update_metadata(register_name)
 
-
     @api(f'{url}metadata/configs', **admin_config)
     def get_configs(**options):
         """
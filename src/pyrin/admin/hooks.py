@@ -3,9 +3,13 @@
 admin hooks module.
 """
 
+import pyrin.admin.api as admin_api
 import pyrin.admin.services as admin_services
+import pyrin.application.services as application_services
 
 from pyrin.utils.custom_print import print_info
+from pyrin.application.decorators import application_hook
+from pyrin.application.hooks import ApplicationHookBase
 from pyrin.validator.auto.hooks import AutoValidatorHookBase
 from pyrin.validator.auto.decorators import auto_validator_hook
 
@@ -25,3 +29,18 @@ class AutoValidatorHook(AutoValidatorHookBase):
         admin_services.populate_main_metadata()
         if count > 0:
             print_info('Total of [{count}] admin pages registered.'.format(count=count))
+
+
+@application_hook()
+class ApplicationHook(ApplicationHookBase):
+    """
+    application hook class.
+    """
+
+    def application_initialized(self):
+        """
+        this method will be got called after application has been fully initialized.
+        """
+
+        if application_services.is_scripting_mode() is False:
+            admin_api.register_routes()
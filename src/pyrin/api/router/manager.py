@@ -23,6 +23,14 @@ class RouterManager(Manager):
 
     package_class = RouterPackage
 
+    # route types mapped by (authenticated, fresh_auth, temporary) values.
+    _route_types = {(False, False, False): PublicRoute,
+                    (False, False, True): PublicTemporaryRoute,
+                    (True, False, False): ProtectedRoute,
+                    (True, False, True): ProtectedTemporaryRoute,
+                    (True, True, False): FreshProtectedRoute,
+                    (True, True, True): FreshProtectedTemporaryRoute}
+
     def create_route(self, rule, **options):
         """
         creates the appropriate route based on the input parameters.
@@ -276,19 +284,13 @@ class RouterManager(Manager):
         lifetime = options.get('lifetime')
         temporary = request_limit is not None or lifetime is not None
 
-        if authenticated is False and fresh_auth is False and temporary is False:
-            return PublicRoute(rule, **options)
-        elif authenticated is False and fresh_auth is False and temporary is True:
-            return PublicTemporaryRoute(rule, **options)
-        elif authenticated is True and fresh_auth is False and temporary is False:
-            return ProtectedRoute(rule, **options)
-        elif authenticated is True and fresh_auth is False and temporary is True:
-            return ProtectedTemporaryRoute(rule, **options)
-        elif authenticated is True and fresh_auth is True and temporary is False:
-            return FreshProtectedRoute(rule, **options)
-        elif authenticated is True and fresh_auth is True and temporary is True:
-            return FreshProtectedTemporaryRoute(rule, **options)
-        else:
+        # values are checked to be exactly bool, to prevent values such as `1` or
+        # unhashable ones to be looked up, as the lookup compares by equality.
+        route_type = None
+        if type(authenticated) is bool and type(fresh_auth) is bool:
+            route_type = self._route_types.get((authenticated, fresh_auth, temporary))
+
+        if route_type is None:
             raise RouteAuthenticationMismatchError('[authenticated={auth}] and '
                                                    '[fresh_auth={fresh}] and '
                                                    '[temporary={temp}] in route '
@@ -298,6 +300,8 @@ class RouterManager(Manager):
                                                            temp=temporary,
                                                            route=rule))
 
+        return route_type(rule, **options)
+
     def _create_route(self, rule, **options):
         """
         creates the appropriate route based on the input parameters.
@@ -228,6 +228,7 @@ class Application(Flask, HookMixin, SignalMixin,
 
         self._context = ApplicationContext()
         self._components = ApplicationComponent()
+        self._resolved_components = {}
 
         # we have to register some components manually because they are
         # referenced in `application.base` module and could not be loaded
@@ -500,6 +501,7 @@ class Application(Flask, HookMixin, SignalMixin,
                           .format(old_instance=old_instance, new_instance=component))
 
         self._components[component.get_id()] = component
+        self._resolved_components.clear()
 
     def remove_component(self, component_id):
         """
@@ -516,6 +518,7 @@ class Application(Flask, HookMixin, SignalMixin,
                                           .format(component_id=component_id))
 
         self._components.pop(component_id)
+        self._resolved_components.clear()
 
     def _get_safe_current_request(self):
         """
@@ -554,17 +557,26 @@ class Application(Flask, HookMixin, SignalMixin,
         if component_custom_key is None:
             component_custom_key = self._extract_component_custom_key()
 
+        # resolved components are cached per name and custom key, so the lookup
+        # for custom implementation and fallback to the default one happens only once.
+        resolved_id = (component_name, component_custom_key)
+        component = self._resolved_components.get(resolved_id)
+        if component is not None:
+            return component
+
         # checking whether is there any custom implementation.
         component_custom_id = \
             Component.make_component_id(component_name,
                                         component_custom_key=component_custom_key)
 
-        if component_custom_id in self._components.keys():
-            return self._components[component_custom_id]
+        component = self._components.get(component_custom_id)
+        if component is None:
+            # getting default component.
+            component_default_id = Component.make_component_id(component_name)
+            component = self._components[component_default_id]
 
-        # getting default component.
-        component_default_id = Component.make_component_id(component_name)
-        return self._components[component_default_id]
+        self._resolved_components[resolved_id] = component
+        return component
 
     def _extract_component_custom_key(self):
         """
@@ -1207,7 +1219,7 @@ class Application(Flask, HookMixin, SignalMixin,
         if endpoint in (None, ''):
             endpoint = self.generate_endpoint(view_func, **options)
 
-        options.update(endpoint=endpoint)
+        options['endpoint'] = endpoint
 
         methods = options.pop('methods', None)
         if methods is not None:
@@ -1240,11 +1252,11 @@ class Application(Flask, HookMixin, SignalMixin,
         # we have to put `view_function=view_func` into options to be able to deliver it
         # to route initialization in the super method. that's because of flask design
         # that does not forward all params to inner method calls.
-        options.update(view_function=view_func)
+        options['view_function'] = view_func
 
         route = self.url_rule_class(rule, methods=methods, **options)
         route.provide_automatic_options = provide_automatic_options
-        self._add_to_map(route, **options)
+        self._add_to_map(route, options.get('replace', False))
 
         old_func = self.view_functions.get(endpoint)
         if old_func is not None and old_func != view_func:
@@ -1312,21 +1324,20 @@ class Application(Flask, HookMixin, SignalMixin,
 
         return function_utils.get_fully_qualified_name(func)
 
-    def _add_to_map(self, route, **options):
+    def _add_to_map(self, route, replace=False):
         """
         adds the given route into map.
 
         :param RouteBase route: route instance to be added into map.
 
-        :keyword bool replace: specifies that this route must replace
-                               any existing route with the same url and http
-                               methods or raise an error if not provided.
-                               defaults to False.
+        :param bool replace: specifies that this route must replace
+                             any existing route with the same url and http
+                             methods or raise an error if not provided.
+                             defaults to False.
 
         :raises DuplicateRouteURLError: duplicate route url error.
         """
 
-        replace = options.get('replace', False)
         existing_routes = self.url_map.get_routes_by_url(route.rule)
 
         duplicate_methods = DTO()
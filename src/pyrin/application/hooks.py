@@ -10,6 +10,12 @@ from pyrin.configuration import ConfigurationPackage
 from pyrin.packaging.hooks import PackagingHookBase
 
 
+# handlers that must be called as soon as their respective package is loaded.
+# we should load configs as soon as configuration package is loaded, to make
+# sure application configs are loaded before any other package needs them.
+_PKG_HANDLERS = {ConfigurationPackage.NAME: application_services.load_configs}
+
+
 class ApplicationHookBase(Hook):
     """
     application hook base class.
@@ -150,8 +156,6 @@ class PackagingHook(PackagingHookBase):
         :param str package_name: name of the loaded package.
         """
 
-        # we should call this method as soon as configuration package is
-        # loaded, to make sure application configs are loaded before any
-        # other package needs them.
-        if package_name == ConfigurationPackage.NAME:
-            application_services.load_configs(**options)
+        handler = _PKG_HANDLERS.get(package_name)
+        if handler is not None:
+            handler(**options)
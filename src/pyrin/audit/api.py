@@ -8,11 +8,20 @@ import pyrin.audit.services as audit_services
 from pyrin.api.router.decorators import api
 
 
-audit_config = audit_services.get_audit_configurations()
-audit_config.update(no_cache=True)
-is_enabled = audit_config.pop('enabled', False)
+def register_routes():
+    """
+    registers audit api routes if audit api is enabled.
+
+    it will be called after application has been initialized. so the audit
+    configurations will not be loaded when application starts in scripting mode.
+    """
+
+    audit_config = audit_services.get_audit_configurations()
+    audit_config.update(no_cache=True)
+    is_enabled = audit_config.pop('enabled', False)
+    if is_enabled is not True:
+        return
 
-if is_enabled is True:
     @api(**audit_config)
     def inspect(**options):
         """
@@ -3,7 +3,9 @@
 audit hooks module.
 """
 
+import pyrin.audit.api as audit_api
 import pyrin.audit.services as audit_services
+import pyrin.application.services as application_services
 import pyrin.configuration.services as config_services
 
 from pyrin.core.structs import Hook
@@ -56,6 +58,14 @@ class ApplicationHook(ApplicationHookBase):
     application hook class.
     """
 
+    def application_initialized(self):
+        """
+        this method will be got called after application has been fully initialized.
+        """
+
+        if application_services.is_scripting_mode() is False:
+            audit_api.register_routes()
+
     def after_runtime_data_prepared(self):
         """
         this method will be got called after runtime data is ready.
@@ -5,12 +5,11 @@ caching decorators module.
 
 from functools import update_wrapper
 
-from werkzeug.utils import cached_property as cached_property_base
-
 import pyrin.caching.services as caching_services
 import pyrin.utils.function as function_utils
 
 from pyrin.core.decorators import class_property
+from pyrin.caching.exceptions import CachedPropertyNameConflictError
 
 
 def cache(*args, **kwargs):
@@ -393,12 +392,16 @@ def custom_cached(name, *old_method, **options):
     return decorator
 
 
-class cached_property(cached_property_base):
+class cached_property:
     """
     a decorator to convert a property into a cached property.
 
     the result of the property will be calculated once and cached.
     the cached value is per instance not per type.
+    the value is cached in the instance dict under the name of the property,
+    so subsequent accesses are plain attribute lookups that never reach
+    this descriptor. setting or deleting the attribute replaces or
+    clears the cached value.
 
     usage example:
 
@@ -406,7 +409,67 @@ class cached_property(cached_property_base):
     def is_valid(self):
         return True
     """
-    pass
+
+    def __init__(self, method, name=None, doc=None):
+        """
+        initializes an instance of cached_property.
+
+        :param function method: decorated method.
+
+        :param str name: name to cache the value under it.
+                         defaults to the name of the attribute that this
+                         property is assigned to if not provided.
+
+        :param str doc: docstring of the property.
+                        defaults to the docstring of decorated method if not provided.
+        """
+
+        self.fget = method
+        self.__name__ = name or method.__name__
+        self.__module__ = method.__module__
+        self.__doc__ = doc or method.__doc__
+        self._has_custom_name = name is not None
+        self._is_name_set = False
+
+    def __set_name__(self, owner, name):
+        """
+        sets the name of this property to the name of the attribute it is assigned to.
+
+        the name will not be changed if a custom name has been provided.
+
+        :param type owner: owner class type.
+        :param str name: name of the attribute.
+
+        :raises CachedPropertyNameConflictError: cached property name conflict error.
+        """
+
+        if self._has_custom_name is True:
+            return
+
+        if self._is_name_set is True and name != self.__name__:
+            raise CachedPropertyNameConflictError('Cached property [{old}] could not be '
+                                                  'assigned to another name [{new}].'
+                                                  .format(old=self.__name__, new=name))
+
+        self.__name__ = name
+        self._is_name_set = True
+
+    def __get__(self, instance, cls=None):
+        """
+        gets the result of decorated method and caches it on the given instance.
+
+        :param instance: instance of parent class.
+        :param type cls: class type.
+
+        :returns: decorated method result.
+        """
+
+        if instance is None:
+            return self
+
+        result = self.fget(instance)
+        instance.__dict__[self.__name__] = result
+        return result
 
 
 class cached_class_property(class_property):
@@ -74,3 +74,10 @@ class InvalidCacheExpireTimeError(CachingManagerException):
     invalid cache expire time error.
     """
     pass
+
+
+class CachedPropertyNameConflictError(CachingManagerException):
+    """
+    cached property name conflict error.
+    """
+    pass
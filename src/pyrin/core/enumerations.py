@@ -195,6 +195,7 @@ class CoreEnumMeta(type):
     # it's members. the below attributes will always remain None and never get populated.
     __enum_names = None
     __enum_values = None
+    __enum_values_set = None
     __enum_dict = None
     __enum_options = None
 
@@ -260,7 +261,10 @@ class CoreEnumMeta(type):
         """
 
         member = cls.get_pure_value(member)
-        return member in cls.values()
+        try:
+            return member in cls.values_set()
+        except TypeError:
+            return False
 
     def __to_dict(cls):
         """
@@ -367,6 +371,7 @@ class CoreEnumMeta(type):
 
         cls.__enum_names = tuple(names)
         cls.__enum_values = tuple(values)
+        cls.__enum_values_set = frozenset(values)
         cls.__enum_dict = dictionary
         cls.__enum_options = tuple(options)
 
@@ -382,6 +387,20 @@ class CoreEnumMeta(type):
 
         return cls.__enum_values
 
+    def values_set(cls):
+        """
+        gets a frozenset containing all values in the enumeration.
+
+        it could be used for fast membership checks.
+
+        :rtype: frozenset
+        """
+
+        if cls.__enum_values_set is None:
+            cls._populate_members()
+
+        return cls.__enum_values_set
+
     def names(cls):
         """
         gets a tuple containing all names in the enumeration.
@@ -495,8 +514,7 @@ class CoreEnum(metaclass=CoreEnumMeta):
         :rtype: bool
         """
 
-        value = cls.get_pure_value(value)
-        return value in cls.values()
+        return value in cls
 
     @classmethod
     def try_str(cls, value):
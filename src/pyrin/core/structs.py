@@ -167,11 +167,8 @@ class DTO(dict):
 
         raise CoreAttributeError('Property [{name}] not found.'.format(name=name))
 
-    def __getitem__(self, item):
-        if item in self:
-            return self.get(item)
-
-        raise CoreKeyError('Key [{name}] not found.'.format(name=item))
+    def __missing__(self, key):
+        raise CoreKeyError('Key [{name}] not found.'.format(name=key))
 
     def __setattr__(self, name, value):
         self[name] = value
@@ -3,6 +3,8 @@
 model base module.
 """
 
+from sqlalchemy import event
+
 from pyrin.core.structs import CoreObject
 from pyrin.core.decorators import class_property
 from pyrin.database.model.mixin import CRUDMixin, MagicMethodMixin, QueryMixin, \
@@ -150,3 +152,19 @@ class BaseEntity(MagicMethodMixin, PrimaryKeyMixin,
         """
 
         return BaseEntity
+
+
+@event.listens_for(BaseEntity, 'mapper_configured', propagate=True)
+def _after_mapper_configured(mapper, entity):
+    """
+    populates the per entity caches after its mapper has been configured.
+
+    column and foreign key names are populated in a single pass
+    and the root base class is resolved at the same time.
+
+    :param Mapper mapper: the configured mapper.
+    :param type[BaseEntity] entity: the mapped entity class.
+    """
+
+    entity._populate_column_names()
+    entity._populate_root_base_class()
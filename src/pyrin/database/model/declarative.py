@@ -34,4 +34,4 @@ class CoreEntity(BaseEntity, metaclass=DeclarativeMeta):
 
     __abstract__ = True
     registry = model_services.get_mapper_registry()
-    metadata = model_services.get_mapper_registry().metadata
+    metadata = registry.metadata
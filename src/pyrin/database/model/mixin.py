@@ -71,7 +71,6 @@ class ColumnMixin(ModelMixinBase):
     """
 
     @class_property
-    @fast_cache
     def all_columns(cls):
         """
         gets all column names of this entity.
@@ -87,10 +86,9 @@ class ColumnMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        return cls.readable_columns + cls.not_readable_columns
+        return cls._get_column_names('all_columns')
 
     @class_property
-    @fast_cache
     def readable_columns(cls):
         """
         gets readable column names of this entity.
@@ -103,17 +101,9 @@ class ColumnMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        columns = tuple(attr.key for attr in info.column_attrs
-                        if cls.is_public(attr.key) is True and
-                        attr.columns[0].is_foreign_key is False and
-                        attr.columns[0].primary_key is False and
-                        attr.columns[0].allow_read is True)
-
-        return columns
+        return cls._get_column_names('readable_columns')
 
     @class_property
-    @fast_cache
     def not_readable_columns(cls):
         """
         gets not readable column names of this entity.
@@ -126,17 +116,9 @@ class ColumnMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        columns = tuple(attr.key for attr in info.column_attrs
-                        if (cls.is_public(attr.key) is False or
-                            attr.columns[0].allow_read is False) and
-                        attr.columns[0].is_foreign_key is False and
-                        attr.columns[0].primary_key is False)
-
-        return columns
+        return cls._get_column_names('not_readable_columns')
 
     @class_property
-    @fast_cache
     def writable_columns(cls):
         """
         gets writable column names of this entity.
@@ -149,17 +131,9 @@ class ColumnMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        columns = tuple(attr.key for attr in info.column_attrs
-                        if cls.is_public(attr.key) is True and
-                        attr.columns[0].is_foreign_key is False and
-                        attr.columns[0].primary_key is False and
-                        attr.columns[0].allow_write is True)
-
-        return columns
+        return cls._get_column_names('writable_columns')
 
     @class_property
-    @fast_cache
     def not_writable_columns(cls):
         """
         gets not writable column names of this entity.
@@ -172,14 +146,81 @@ class ColumnMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
+        return cls._get_column_names('not_writable_columns')
+
+    @classmethod
+    def _get_column_names(cls, name):
+        """
+        gets the column names of this entity which are cached with given name.
+
+        the values are looked up in the entity's own dict, so a subclass
+        never gets the column names of its parent entity.
+
+        :param str name: name of cached column names.
+
+        :rtype: tuple[str]
+        """
+
+        column_names = cls.__dict__.get('_column_names')
+        if column_names is None:
+            column_names = cls._populate_column_names()
+
+        return column_names[name]
+
+    @classmethod
+    def _populate_column_names(cls):
+        """
+        populates all column and foreign key names of this entity in a single pass.
+
+        the result will be set on the entity class itself and returned. this method
+        will be get called after the mapper of each entity has been configured.
+
+        :rtype: dict[str, tuple[str]]
+        """
+
+        # each group holds lists of readable, not readable,
+        # writable and not writable column names respectively.
+        columns = ([], [], [], [])
+        foreign_keys = ([], [], [], [])
         info = sqla_inspect(cls)
-        columns = tuple(attr.key for attr in info.column_attrs
-                        if (cls.is_public(attr.key) is False or
-                            attr.columns[0].allow_write is False) and
-                        attr.columns[0].is_foreign_key is False and
-                        attr.columns[0].primary_key is False)
+        for attr in info.column_attrs:
+            column = attr.columns[0]
+            if column.primary_key is True:
+                continue
 
-        return columns
+            if column.is_foreign_key is True:
+                readable, not_readable, writable, not_writable = foreign_keys
+            else:
+                readable, not_readable, writable, not_writable = columns
+
+            is_public = cls.is_public(attr.key)
+            if is_public is True and column.allow_read is True:
+                readable.append(attr.key)
+            else:
+                not_readable.append(attr.key)
+
+            if is_public is True and column.allow_write is True:
+                writable.append(attr.key)
+            else:
+                not_writable.append(attr.key)
+
+        readable, not_readable, writable, not_writable = columns
+        fk_readable, fk_not_readable, fk_writable, fk_not_writable = foreign_keys
+        column_names = dict(all_columns=tuple(readable + not_readable),
+                            readable_columns=tuple(readable),
+                            not_readable_columns=tuple(not_readable),
+                            writable_columns=tuple(writable),
+                            not_writable_columns=tuple(not_writable),
+                            foreign_key_columns=tuple(fk_readable + fk_not_readable),
+                            readable_foreign_key_columns=tuple(fk_readable),
+                            not_readable_foreign_key_columns=tuple(fk_not_readable),
+                            writable_foreign_key_columns=tuple(fk_writable),
+                            not_writable_foreign_key_columns=tuple(fk_not_writable))
+
+        # the names are set using `type.__setattr__` to bypass the declarative
+        # `__setattr__`, which expires the memoizations of the entity's mapper.
+        type.__setattr__(cls, '_column_names', column_names)
+        return column_names
 
     @classmethod
     def populate_cache(cls):
@@ -187,10 +228,7 @@ class ColumnMixin(ModelMixinBase):
         populates all related caches.
         """
 
-        temp = cls.readable_columns
-        temp = cls.not_readable_columns
-        temp = cls.writable_columns
-        temp = cls.not_writable_columns
+        temp = cls.all_columns
         super().populate_cache()
 
 
@@ -429,10 +467,7 @@ class PrimaryKeyMixin(ModelMixinBase):
             return False
 
         if isinstance(primary_key, tuple):
-            if len(primary_key) <= 0:
-                return False
-            else:
-                return all(pk is not None for pk in primary_key)
+            return len(primary_key) > 0 and None not in primary_key
 
         return True
 
@@ -579,7 +614,6 @@ class ForeignKeyMixin(ModelMixinBase):
     """
 
     @class_property
-    @fast_cache
     def foreign_key_columns(cls):
         """
         gets all foreign key column names of this entity.
@@ -596,10 +630,9 @@ class ForeignKeyMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        return cls.readable_foreign_key_columns + cls.not_readable_foreign_key_columns
+        return cls._get_column_names('foreign_key_columns')
 
     @class_property
-    @fast_cache
     def readable_foreign_key_columns(cls):
         """
         gets the readable foreign key column names of this entity.
@@ -613,17 +646,9 @@ class ForeignKeyMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        fk = tuple(attr.key for attr in info.column_attrs
-                   if attr.columns[0].is_foreign_key is True
-                   and attr.columns[0].primary_key is False
-                   and cls.is_public(attr.key) is True
-                   and attr.columns[0].allow_read is True)
-
-        return fk
+        return cls._get_column_names('readable_foreign_key_columns')
 
     @class_property
-    @fast_cache
     def not_readable_foreign_key_columns(cls):
         """
         gets not readable foreign key column names of this entity.
@@ -637,17 +662,9 @@ class ForeignKeyMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        fk = tuple(attr.key for attr in info.column_attrs
-                   if attr.columns[0].is_foreign_key is True
-                   and attr.columns[0].primary_key is False and
-                   (cls.is_public(attr.key) is False or
-                    attr.columns[0].allow_read is False))
-
-        return fk
+        return cls._get_column_names('not_readable_foreign_key_columns')
 
     @class_property
-    @fast_cache
     def writable_foreign_key_columns(cls):
         """
         gets the writable foreign key column names of this entity.
@@ -661,17 +678,9 @@ class ForeignKeyMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        fk = tuple(attr.key for attr in info.column_attrs
-                   if attr.columns[0].is_foreign_key is True
-                   and attr.columns[0].primary_key is False
-                   and cls.is_public(attr.key) is True
-                   and attr.columns[0].allow_write is True)
-
-        return fk
+        return cls._get_column_names('writable_foreign_key_columns')
 
     @class_property
-    @fast_cache
     def not_writable_foreign_key_columns(cls):
         """
         gets not writable foreign key column names of this entity.
@@ -685,14 +694,7 @@ class ForeignKeyMixin(ModelMixinBase):
         :rtype: tuple[str]
         """
 
-        info = sqla_inspect(cls)
-        fk = tuple(attr.key for attr in info.column_attrs
-                   if attr.columns[0].is_foreign_key is True
-                   and attr.columns[0].primary_key is False and
-                   (cls.is_public(attr.key) is False or
-                    attr.columns[0].allow_write is False))
-
-        return fk
+        return cls._get_column_names('not_writable_foreign_key_columns')
 
     @classmethod
     def populate_cache(cls):
@@ -700,10 +702,7 @@ class ForeignKeyMixin(ModelMixinBase):
         populates all related caches.
         """
 
-        temp = cls.readable_foreign_key_columns
-        temp = cls.not_readable_foreign_key_columns
-        temp = cls.writable_foreign_key_columns
-        temp = cls.not_writable_foreign_key_columns
+        temp = cls.foreign_key_columns
         super().populate_cache()
 
 
@@ -748,11 +747,8 @@ class AttributeMixin(ModelMixinBase):
         :rtype: CoreImmutableDict
         """
 
-        result = dict()
-        for name, column in cls.all_column_attributes.items():
-            result[column] = name
-
-        return CoreImmutableDict(result)
+        attributes = cls.all_column_attributes
+        return CoreImmutableDict(zip(attributes.values(), attributes.keys()))
 
     @class_property
     @fast_cache
@@ -1074,19 +1070,15 @@ class ConverterMixin:
             all_attributes = self.all_readable_attributes
             relations = self.exposed_relationships
 
-        requested_relationships = []
         all_attributes = set(all_attributes)
         if len(requested_columns) > 0:
             requested_columns = requested_columns.intersection(all_attributes)
         else:
             requested_columns = all_attributes.difference(excluded_columns)
 
-        result = DTO()
-        for col in requested_columns:
-            if col in relations:
-                requested_relationships.append(col)
-            else:
-                result[rename.get(col, col)] = getattr(self, col)
+        requested_relationships = requested_columns.intersection(relations)
+        result = DTO((rename.get(col, col), getattr(self, col))
+                     for col in requested_columns.difference(requested_relationships))
 
         if depth > 0 and len(requested_relationships) > 0:
             if depth > self.MAX_DEPTH:
@@ -1188,50 +1180,74 @@ class ConverterMixin:
             ignore_fk = kwargs.pop('ignore_fk', SECURE_FALSE)
             ignore_relationships = kwargs.pop('ignore_relationships', SECURE_TRUE)
 
-        accessible_columns = self.writable_columns
-        if writable is SECURE_FALSE:
-            accessible_columns = self.all_columns
+        accessible_attributes = self._get_accessible_attributes(
+            writable is not SECURE_FALSE, ignore_pk is SECURE_FALSE,
+            ignore_fk is not SECURE_TRUE, ignore_relationships is SECURE_FALSE)
 
-        accessible_hybrid_properties = self.writable_hybrid_properties
-        if writable is SECURE_FALSE:
-            accessible_hybrid_properties = self.all_setter_hybrid_properties
+        not_existed = kwargs.keys() - accessible_attributes
+        if len(not_existed) > 0:
+            if ignore_invalid is SECURE_FALSE:
+                raise ColumnNotExistedError('Provided columns, relationships or properties '
+                                            '{columns} are not available in entity [{entity}].'
+                                            .format(columns=list(not_existed),
+                                                    entity=self.get_fully_qualified_name()))
 
-        accessible_pk = ()
-        if ignore_pk is SECURE_FALSE:
-            if writable is SECURE_FALSE:
-                accessible_pk = self.primary_key_columns
-            else:
-                accessible_pk = self.writable_primary_key_columns
+            for column in not_existed:
+                kwargs.pop(column)
 
-        accessible_fk = ()
-        if ignore_fk is not SECURE_TRUE:
-            if writable is SECURE_FALSE:
-                accessible_fk = self.foreign_key_columns
-            else:
-                accessible_fk = self.writable_foreign_key_columns
+        # all remaining values are accessible, so they could
+        # be set without checking each one of them again.
+        for column, value in kwargs.items():
+            setattr(self, column, value)
 
-        accessible_relationships = ()
-        if ignore_relationships is SECURE_FALSE:
-            if writable is SECURE_FALSE:
-                accessible_relationships = self.relationships
-            else:
-                accessible_relationships = self.exposed_relationships
+    @classmethod
+    def _get_accessible_attributes(cls, writable, pk, fk, relationships):
+        """
+        gets the attribute names of this entity which could be populated from dict.
 
-        all_accessible_columns = accessible_pk + accessible_fk + \
-            accessible_columns + accessible_relationships + accessible_hybrid_properties
+        the result will be calculated once for each combination of
+        inputs and cached per entity type.
 
-        provided_columns = set(kwargs.keys())
-        result_columns = set(all_accessible_columns).intersection(provided_columns)
-        if ignore_invalid is SECURE_FALSE:
-            not_existed = provided_columns.difference(result_columns)
-            if len(not_existed) > 0:
-                raise ColumnNotExistedError('Provided columns, relationships or properties '
-                                            '{columns} are not available in entity [{entity}].'
-                                            .format(columns=list(not_existed),
-                                                    entity=self.get_fully_qualified_name()))
+        :param bool writable: only include attributes which are writable.
+        :param bool pk: include primary key columns.
+        :param bool fk: include foreign key columns.
+        :param bool relationships: include relationship properties.
+
+        :rtype: frozenset[str]
+        """
+
+        cache = cls.__dict__.get('_accessible_attributes')
+        if cache is None:
+            cache = {}
+            # the cache is set using `type.__setattr__` to bypass the declarative
+            # `__setattr__`, which expires the memoizations of the entity's mapper.
+            type.__setattr__(cls, '_accessible_attributes', cache)
 
-        for column in result_columns:
-            setattr(self, column, kwargs.get(column))
+        key = (writable, pk, fk, relationships)
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+        if writable is True:
+            accessible = cls.writable_columns + cls.writable_hybrid_properties
+            if pk is True:
+                accessible += cls.writable_primary_key_columns
+            if fk is True:
+                accessible += cls.writable_foreign_key_columns
+            if relationships is True:
+                accessible += cls.exposed_relationships
+        else:
+            accessible = cls.all_columns + cls.all_setter_hybrid_properties
+            if pk is True:
+                accessible += cls.primary_key_columns
+            if fk is True:
+                accessible += cls.foreign_key_columns
+            if relationships is True:
+                accessible += cls.relationships
+
+        result = frozenset(accessible)
+        cache[key] = result
+        return result
 
     def set_attribute(self, name, value, silent=True):
         """
@@ -1409,9 +1425,12 @@ class MagicMethodMixin(ModelMixinBase):
         :rtype: bool
         """
 
-        if isinstance(other, self.root_base_class):
-            if self._is_primary_key_comparable(self.primary_key()) is True:
-                return self.primary_key() == other.primary_key()
+        # entities of the same type are the common case, so the root
+        # base class lookup and its isinstance check could be skipped.
+        if type(other) is type(self) or isinstance(other, self.root_base_class):
+            primary_key = self.primary_key()
+            if self._is_primary_key_comparable(primary_key) is True:
+                return primary_key == other.primary_key()
             else:
                 return self is other
 
@@ -1439,9 +1458,9 @@ class MagicMethodMixin(ModelMixinBase):
         :rtype: int
         """
 
-        if self._is_primary_key_comparable(self.primary_key()) is True:
-            return hash('{root_base}.{pk}'.format(root_base=self.root_base_class,
-                                                  pk=self.primary_key()))
+        primary_key = self.primary_key()
+        if self._is_primary_key_comparable(primary_key) is True:
+            return hash((self.root_base_class, primary_key))
 
         return super().__hash__()
 
@@ -1452,11 +1471,9 @@ class MagicMethodMixin(ModelMixinBase):
         :rtype: str
         """
 
-        return '{fullname} -> {pk}'.format(fullname=self.get_fully_qualified_name(),
-                                           pk=self.primary_key())
+        return f'{self.get_fully_qualified_name()} -> {self.primary_key()}'
 
     @class_property
-    @fast_cache
     def root_base_class(cls):
         """
         gets root base class of this entity.
@@ -1477,14 +1494,33 @@ class MagicMethodMixin(ModelMixinBase):
         {CoreEntity -> BaseEntity, A -> CoreEntity, B -> A, C -> A}
         then, root base class of A, B and C is A.
 
-        root base class will be calculated once and cached per entity type.
+        root base class will be calculated once and cached on each entity type.
+
+        :rtype: type
+        """
+
+        base = cls.__dict__.get('_root_base_class')
+        if base is None:
+            base = cls._populate_root_base_class()
+
+        return base
+
+    @classmethod
+    def _populate_root_base_class(cls):
+        """
+        populates the root base class of this entity.
+
+        the result will be set on the entity class itself and returned. this method
+        will be get called after the mapper of each entity has been configured.
 
         :rtype: type
         """
 
-        bases = inspect.getmro(cls)
-        root_base_entity_index = bases.index(cls.declarative_base_class) - 1
-        base = bases[root_base_entity_index]
+        bases = cls.__mro__
+        base = bases[bases.index(cls.declarative_base_class) - 1]
+        # the base is set using `type.__setattr__` to bypass the declarative
+        # `__setattr__`, which expires the memoizations of the entity's mapper.
+        type.__setattr__(cls, '_root_base_class', base)
         return base
 
     @class_property
@@ -13,7 +13,7 @@ import sqlalchemy.dialects.sybase.base as sybase_types
 
 from sqlalchemy.exc import ArgumentError
 from sqlalchemy.sql.type_api import Variant
-from sqlalchemy import Column, util, ARRAY, BigInteger, SmallInteger, Integer
+from sqlalchemy import Column, ARRAY, BigInteger, SmallInteger, Integer
 
 import pyrin.utils.misc as misc_utils
 
@@ -201,22 +201,24 @@ class CoreColumn(Column, CoreColumnOperators):
         :raises InvalidColumnAccessLevelError: invalid column access level error.
         """
 
-        args = list(args)
-        name, type_ = self._extract_name_and_type(args, kwargs)
+        name, type_, args = self._split_name_and_type(args, kwargs)
         if type_ is not None:
             self._set_required_info(type_, kwargs)
 
         kwargs.update(name=name, type_=type_)
 
-        self.allow_read = kwargs.pop('allow_read', True)
-        self.allow_write = kwargs.pop('allow_write', True)
-        self.min_value = kwargs.pop('min_value', None)
-        self.max_value = kwargs.pop('max_value', None)
-        self.check_in = kwargs.pop('check_in', None)
-        self.check_not_in = kwargs.pop('check_not_in', None)
-        self.validated = kwargs.pop('validated', True)
-        self.validated_find = kwargs.pop('validated_find', self.validated)
-        self.validated_range = kwargs.pop('validated_range', self.validated_find)
+        # custom options are extracted through a local alias of
+        # `kwargs.pop` to avoid an attribute lookup for each option.
+        pop = kwargs.pop
+        self.allow_read = pop('allow_read', True)
+        self.allow_write = pop('allow_write', True)
+        self.min_value = pop('min_value', None)
+        self.max_value = pop('max_value', None)
+        self.check_in = pop('check_in', None)
+        self.check_not_in = pop('check_not_in', None)
+        self.validated = pop('validated', True)
+        self.validated_find = pop('validated_find', self.validated)
+        self.validated_range = pop('validated_range', self.validated_find)
 
         self.check_in_enum = None
         self.check_not_in_enum = None
@@ -230,6 +232,17 @@ class CoreColumn(Column, CoreColumnOperators):
             self.check_not_in_enum = self.check_not_in
             self.check_not_in = self.check_not_in.values()
 
+        # check constraints are only generated for named non primary key columns.
+        # proxy columns are created by sqlalchemy for each alias, subquery and other
+        # selectables. they do not carry ddl, so no check constraints are built for them.
+        self._generate_constraints = '_proxies' not in kwargs and \
+            name not in (None, '') and \
+            kwargs.get('primary_key', False) is not True and \
+            (self.min_value is not None or
+             self.max_value is not None or
+             self.check_in is not None or
+             self.check_not_in is not None)
+
         super().__init__(*args, **kwargs)
 
         # we have to perform this assertion at the end to have the column name available.
@@ -271,59 +284,94 @@ class CoreColumn(Column, CoreColumnOperators):
         """
 
         custom_items = self._get_custom_schema_items()
-        if self.name in (None, '') or self.type is None:
+        if self._generate_constraints is False:
             return custom_items
 
-        if self.primary_key is not True:
-            minimum = None
-            maximum = None
-            if self.min_value is not None and not callable(self.min_value):
-                minimum = self.min_value
-
-            if self.max_value is not None and not callable(self.max_value):
-                maximum = self.max_value
-
-            if minimum is not None or maximum is not None:
-                range_constraint = range_check_constraint(self.name,
-                                                          min_value=minimum,
-                                                          max_value=maximum)
-                custom_items.append(range_constraint)
-
-            if self.check_in is not None and self.check_not_in is not None:
-                raise CheckConstraintConflictError('Both "check_in" and "check_not_in" could '
-                                                   'not be provided at the same time.')
-
-            is_check_in_callable = callable(self.check_in)
-            is_check_not_in_callable = callable(self.check_not_in)
-
-            if self.check_in is not None and not is_check_in_callable \
-                    and not (isinstance(self.check_in, LIST_TYPES)
-                             and len(self.check_in) > 0):
-                raise InvalidCheckConstraintError('Provided value for "check_in" '
-                                                  'must be an iterable with at least 1 item.')
-
-            if self.check_not_in is not None and not is_check_not_in_callable \
-                    and not (isinstance(self.check_not_in, LIST_TYPES)
-                             and len(self.check_not_in) > 0):
-                raise InvalidCheckConstraintError('Provided value for "check_not_in" '
-                                                  'must be an iterable with at least 1 item.')
-
-            valid_list = None
-            invalid_list = None
-            if self.check_in is not None and not is_check_in_callable:
-                valid_list = self.check_in
-            elif self.check_not_in is not None and not is_check_not_in_callable:
-                invalid_list = self.check_not_in
-
-            if valid_list is not None:
-                constraint = check_constraint(self.name, valid_list)
-                custom_items.append(constraint)
-            elif invalid_list is not None:
-                constraint = check_constraint(self.name, invalid_list, use_in=False)
-                custom_items.append(constraint)
+        minimum, maximum, values, use_in = self._get_check_constraint_plan()
+        if minimum is not None or maximum is not None:
+            range_constraint = range_check_constraint(self.name,
+                                                      min_value=minimum,
+                                                      max_value=maximum)
+            custom_items.append(range_constraint)
+
+        if values is not None:
+            constraint = check_constraint(self.name, values, use_in=use_in)
+            custom_items.append(constraint)
 
         return custom_items
 
+    def _get_check_constraint_plan(self):
+        """
+        gets the values of check constraints that must be generated for this column.
+
+        the returned tuple contains `minimum` and `maximum` of range check
+        constraint, `values` of check constraint and `use_in` which specifies
+        that it should be an `in` check or a `not in` check. each value that
+        must not produce a constraint is None.
+
+        :raises CheckConstraintConflictError: check constraint conflict error.
+        :raises InvalidCheckConstraintError: invalid check constraint error.
+
+        :returns: tuple[object minimum, object maximum, list values, bool use_in]
+        :rtype: tuple[object, object, list, bool]
+        """
+
+        self._validate_check_constraints()
+
+        minimum = None
+        maximum = None
+        if self.min_value is not None and not callable(self.min_value):
+            minimum = self.min_value
+
+        if self.max_value is not None and not callable(self.max_value):
+            maximum = self.max_value
+
+        values = None
+        use_in = True
+        if self.check_in is not None and not callable(self.check_in):
+            values = self.check_in
+        elif self.check_not_in is not None and not callable(self.check_not_in):
+            values = self.check_not_in
+            use_in = False
+
+        return minimum, maximum, values, use_in
+
+    def _validate_check_constraints(self):
+        """
+        validates the provided values of `check_in` and `check_not_in` of this column.
+
+        callable values are not validated, because they will not
+        be used for generating check constraints.
+
+        :raises CheckConstraintConflictError: check constraint conflict error.
+        :raises InvalidCheckConstraintError: invalid check constraint error.
+        """
+
+        if self.check_in is not None and self.check_not_in is not None:
+            raise CheckConstraintConflictError('Both "check_in" and "check_not_in" could '
+                                               'not be provided at the same time.')
+
+        if self.check_in is not None and not callable(self.check_in):
+            self._validate_check_values(self.check_in, 'check_in')
+
+        elif self.check_not_in is not None and not callable(self.check_not_in):
+            self._validate_check_values(self.check_not_in, 'check_not_in')
+
+    def _validate_check_values(self, values, option):
+        """
+        validates given values to be used for generating a check constraint.
+
+        :param list | tuple | set values: values to be validated.
+        :param str option: the option name which values are provided for.
+
+        :raises InvalidCheckConstraintError: invalid check constraint error.
+        """
+
+        if not isinstance(values, LIST_TYPES) or len(values) <= 0:
+            raise InvalidCheckConstraintError('Provided value for "{option}" must be '
+                                              'an iterable with at least 1 item.'
+                                              .format(option=option))
+
     def _get_custom_schema_items(self):
         """
         gets custom schema items for this column.
@@ -342,9 +390,10 @@ class CoreColumn(Column, CoreColumnOperators):
         """
 
         custom_items = self._get_schema_items()
-        args = list(args)
-        args.extend(custom_items)
-        super()._init_items(*args)
+        if len(custom_items) > 0:
+            super()._init_items(*args, *custom_items)
+        else:
+            super()._init_items(*args)
 
     def _real_name(self):
         """
@@ -353,8 +402,7 @@ class CoreColumn(Column, CoreColumnOperators):
         :rtype: str
         """
 
-        for column in self.base_columns:
-            return column.name
+        return next(iter(self.base_columns)).name
 
     def _extract_name_and_type(self, args, kwargs):
         """
@@ -372,22 +420,55 @@ class CoreColumn(Column, CoreColumnOperators):
         :rtype: tuple[str, TypeEngine]
         """
 
+        name, type_, remaining_args = self._split_name_and_type(args, kwargs)
+        consumed = len(args) - len(remaining_args)
+        if consumed > 0 and isinstance(args, list):
+            del args[:consumed]
+
+        return name, type_
+
+    def _split_name_and_type(self, args, kwargs):
+        """
+        splits name and type parameters from given inputs.
+
+        name and type are removed from given kwargs in-place and the remaining
+        positional arguments are returned. it returns None as each parameter
+        that is not given. unlike `_extract_name_and_type`, it does not need
+        a list of positional arguments and does not change them.
+
+        :param tuple args: column positional arguments.
+        :param dict kwargs: column keyword arguments.
+
+        :raises ArgumentError: argument error.
+
+        :returns: tuple[str name, TypeEngine type, tuple args]
+        :rtype: tuple[str, TypeEngine, tuple]
+        """
+
         name = kwargs.pop('name', None)
         type_ = kwargs.pop('type_', None)
-        if len(args) > 0:
-            if isinstance(args[0], util.string_types):
-                if name is not None:
-                    raise ArgumentError('May not pass name positionally and as a keyword.')
-                name = args.pop(0)
-
-        if len(args) > 0:
-            column_type = args[0]
-            if hasattr(column_type, "_sqla_type"):
-                if type_ is not None:
-                    raise ArgumentError('May not pass type_ positionally and as a keyword.')
-                type_ = args.pop(0)
+        if len(args) <= 0:
+            return name, type_, args
 
-        return name, type_
+        index = 0
+        column_type = args[0]
+        if isinstance(column_type, str):
+            if name is not None:
+                raise ArgumentError('May not pass name positionally and as a keyword.')
+            name = column_type
+            index = 1
+            column_type = args[1] if len(args) > 1 else None
+
+        if getattr(column_type, '_sqla_type', None) is not None:
+            if type_ is not None:
+                raise ArgumentError('May not pass type_ positionally and as a keyword.')
+            type_ = column_type
+            index += 1
+
+        if index > 0:
+            args = args[index:]
+
+        return name, type_, args
 
     def _copy_custom_attributes(self, column):
         """
@@ -430,6 +511,7 @@ class CoreColumn(Column, CoreColumnOperators):
         column.validated_range = self.validated_range
         column.check_in_enum = self.check_in_enum
         column.check_not_in_enum = self.check_not_in_enum
+        column._generate_constraints = self._generate_constraints
 
         return column
 
@@ -491,11 +573,21 @@ class CoreColumn(Column, CoreColumnOperators):
         if self.table is None:
             return self._real_name()
 
-        for single_column in self.table.columns:
-            if single_column.name == self.name:
-                for base_column in single_column.base_columns:
-                    return '{table}.{column}'.format(table=base_column.table.fullname,
-                                                     column=self._real_name())
+        # table columns are keyed by column key, so the column could be found
+        # directly. the names are compared to keep the lookup by name semantic.
+        single_column = self.table.columns.get(self.key)
+        if single_column is None or single_column.name != self.name:
+            single_column = None
+            for item in self.table.columns:
+                if item.name == self.name:
+                    single_column = item
+                    break
+
+        if single_column is None:
+            return None
+
+        base_column = next(iter(single_column.base_columns))
+        return f'{base_column.table.fullname}.{self._real_name()}'
 
     @property
     def is_foreign_key(self):
@@ -505,4 +597,4 @@ class CoreColumn(Column, CoreColumnOperators):
         :rtype: bool
         """
 
-        return len(self.foreign_keys) > 0
+        return bool(self.foreign_keys)
@@ -215,8 +215,7 @@ class StringColumn(CoreColumn):
         self.allow_blank = kwargs.pop('allow_blank', False)
         self.allow_whitespace = kwargs.pop('allow_whitespace', False)
 
-        args = list(args)
-        name, type_ = self._extract_name_and_type(args, kwargs)
+        name, type_, args = self._split_name_and_type(args, kwargs)
         if type_ is None:
             type_ = self.DEFAULT_TYPE
 
@@ -228,7 +227,8 @@ class StringColumn(CoreColumn):
         if isinstance(type_, type) and self.max_length is not None:
             type_ = type_(length=self.max_length)
 
-        kwargs.update(name=name, type_=type_)
+        kwargs['name'] = name
+        kwargs['type_'] = type_
 
         super().__init__(*args, **kwargs)
 
@@ -353,7 +353,8 @@ class PKColumn(CoreColumn):
         :raises InvalidColumnAccessLevelError: invalid column access level error.
         """
 
-        kwargs.update(nullable=False, primary_key=True)
+        kwargs['nullable'] = False
+        kwargs['primary_key'] = True
         kwargs.setdefault('allow_write', False)
         kwargs.setdefault('index', True)
         kwargs.pop('onupdate', None)
@@ -449,8 +450,7 @@ class AutoPKColumn(PKColumn):
         :raises InvalidColumnAccessLevelError: invalid column access level error.
         """
 
-        args = list(args)
-        name, type_ = self._extract_name_and_type(args, kwargs)
+        name, type_, args = self._split_name_and_type(args, kwargs)
         if type_ is None:
             type_ = self.DEFAULT_TYPE
 
@@ -470,10 +470,14 @@ class AutoPKColumn(PKColumn):
         if not is_variant:
             type_ = type_.with_variant(Integer, DialectEnum.SQLITE)
 
-        kwargs.update(name=name, type_=type_, autoincrement=True, min_value=1)
+        kwargs['name'] = name
+        kwargs['type_'] = type_
+        kwargs['autoincrement'] = True
+        kwargs['min_value'] = 1
         kwargs.pop('default', None)
         kwargs.pop('server_default', None)
-        kwargs.update(validated=False)
+
+        kwargs['validated'] = False
         kwargs.setdefault('validated_find', True)
 
         super().__init__(*args, **kwargs)
@@ -685,6 +689,7 @@ class FKColumn(CoreColumn):
                                        validator will be registered for it and this value
                                        will be ignored.
 
+        :raises InvalidFKColumnReferenceTypeError: invalid fk column reference type error.
         :raises InvalidColumnAccessLevelError: invalid column access level error.
         """
 
@@ -692,6 +697,17 @@ class FKColumn(CoreColumn):
         self._fk_on_update = kwargs.pop('fk_on_update', None)
         self._fk_on_delete = kwargs.pop('fk_on_delete', None)
 
+        if self._fk is not None and not isinstance(self._fk, (str,
+                                                              InstrumentedAttribute,
+                                                              CoreColumn)):
+            raise InvalidFKColumnReferenceTypeError('Foreign key reference column '
+                                                    'must be a string or a column instance.')
+
+        # this is to prevent sqlalchemy errors.
+        # because metadata uses uninitialized entities.
+        if self._fk is None:
+            self._fk = ''
+
         kwargs.setdefault('index', True)
         kwargs.setdefault('nullable', False)
 
@@ -703,22 +719,9 @@ class FKColumn(CoreColumn):
 
         it will generate required fk constraint.
 
-        :raises InvalidFKColumnReferenceTypeError: invalid fk column reference type error.
-
         :rtype: list
         """
 
-        if self._fk is not None and not isinstance(self._fk, (str,
-                                                              InstrumentedAttribute,
-                                                              CoreColumn)):
-            raise InvalidFKColumnReferenceTypeError('Foreign key reference column '
-                                                    'must be a string or a column instance.')
-
-        # this is to prevent sqlalchemy errors.
-        # because metadata uses uninitialized entities.
-        if self._fk is None:
-            self._fk = ''
-
         return [ForeignKey(self._fk,
                            onupdate=self._fk_on_update,
                            ondelete=self._fk_on_delete)]
@@ -910,8 +913,8 @@ class HiddenColumn(CoreColumn):
                                        will be ignored.
         """
 
-        kwargs.update(allow_read=False)
-        kwargs.update(allow_write=False)
+        kwargs['allow_read'] = False
+        kwargs['allow_write'] = False
 
         super().__init__(*args, **kwargs)
 
@@ -1773,8 +1776,7 @@ class TextColumn(StringColumn):
         :raises InvalidColumnAccessLevelError: invalid column access level error.
         """
 
-        args = list(args)
-        name, type_ = self._extract_name_and_type(args, kwargs)
+        name, type_, args = self._split_name_and_type(args, kwargs)
         if type_ is None:
             type_ = self.DEFAULT_TYPE
 
@@ -1783,6 +1785,7 @@ class TextColumn(StringColumn):
                                                'instance or subclass of [{text}].'
                                                .format(text=Text))
 
-        kwargs.update(name=name, type_=type_)
+        kwargs['name'] = name
+        kwargs['type_'] = type_
 
         super().__init__(*args, **kwargs)
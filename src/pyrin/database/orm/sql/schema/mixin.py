@@ -122,8 +122,7 @@ class SequenceColumnMixin:
         :raises InvalidColumnAccessLevelError: invalid column access level error.
         """
 
-        args = list(args)
-        name, type_ = self._extract_name_and_type(args, kwargs)
+        name, type_, args = self._split_name_and_type(args, kwargs)
         if type_ is None:
             type_ = self.DEFAULT_TYPE
 
@@ -141,7 +140,7 @@ class SequenceColumnMixin:
         sequence_instance = Sequence(sequence, **sequence_kwargs)
         # this is to prevent sqlalchemy errors.
         if sequence is not None:
-            args.append(sequence_instance)
+            args = (*args, sequence_instance)
 
         kwargs.setdefault('allow_write', False)
         kwargs.setdefault('nullable', False)
@@ -233,8 +232,7 @@ class GUIDColumnMixin:
         :raises InvalidColumnAccessLevelError: invalid column access level error.
         """
 
-        args = list(args)
-        name, type_ = self._extract_name_and_type(args, kwargs)
+        name, type_, args = self._split_name_and_type(args, kwargs)
 
         kwargs.setdefault('allow_write', False)
         kwargs.setdefault('nullable', False)
@@ -416,8 +414,7 @@ class TypeMixin:
         :raises InvalidColumnAccessLevelError: invalid column access level error.
         """
 
-        args = list(args)
-        name, type_ = self._extract_name_and_type(args, kwargs)
+        name, type_, args = self._split_name_and_type(args, kwargs)
         kwargs.update(name=name, type_=self._column_type)
 
         super().__init__(*args, **kwargs)
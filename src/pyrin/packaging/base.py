@@ -39,7 +39,7 @@ class Package(CoreObject):
     #    (not class or function level), or uses decorators or implements
     #    any hooks of package B, then package A is dependent on B and must add B
     #    into its `DEPENDS` list.
-    DEPENDS = []
+    DEPENDS = ()
 
     # specifies that this package is enabled and must be loaded.
     ENABLED = True
@@ -62,16 +62,19 @@ class Package(CoreObject):
     # all configuration stores that should be loaded automatically by this package.
     # note that the relevant config file for them will also be created in application
     # settings path based on pyrin default setting files if not available.
-    CONFIG_STORE_NAMES = []
+    CONFIG_STORE_NAMES = ()
 
     # all configuration stores that should not be loaded automatically by this package.
     # note that the relevant config file for them will be created in application
     # settings path based on pyrin default setting files if not available.
-    EXTRA_CONFIG_STORE_NAMES = []
+    EXTRA_CONFIG_STORE_NAMES = ()
 
     # notice that any package inside pyrin which adds values in either
     # of `CONFIG_STORE_NAMES` or `EXTRA_CONFIG_STORE_NAMES` must also
     # add `pyrin.configuration` into its `DEPENDS` list.
+    # the defaults of `DEPENDS`, `CONFIG_STORE_NAMES` and `EXTRA_CONFIG_STORE_NAMES`
+    # are empty tuples, because they are shared between all subclasses that do not
+    # set them. subclasses should assign their own list instead of mutating them.
 
     def load_configs(self, config_services):
         """
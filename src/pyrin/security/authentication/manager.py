@@ -94,9 +94,9 @@ class AuthenticationManager(Manager):
         :rtype: str
         """
 
-        current_request = session_services.get_current_request()
-        if current_request.url_rule and isinstance(current_request.url_rule, ProtectedRoute):
-            return current_request.url_rule.authenticator
+        url_rule = session_services.get_current_request().url_rule
+        if isinstance(url_rule, ProtectedRoute):
+            return url_rule.authenticator
 
         return None
 
@@ -13,6 +13,14 @@ from pyrin.security.encryption.decorators import encrypter
 from pyrin.security.encryption.handlers.base import RSAEncrypterBase
 
 
+# hash and padding objects are immutable, so a single
+# instance of each one is shared by all operations.
+SHA256_ALGORITHM = hashes.SHA256()
+OAEP_PADDING = padding.OAEP(mgf=padding.MGF1(algorithm=SHA256_ALGORITHM),
+                            algorithm=SHA256_ALGORITHM,
+                            label=None)
+
+
 @encrypter()
 class RSA256Encrypter(RSAEncrypterBase):
     """
@@ -44,11 +52,7 @@ class RSA256Encrypter(RSAEncrypterBase):
         :rtype: bytes
         """
 
-        return self._public_key.encrypt(text.encode(self._encoding),
-                                        padding.OAEP(
-                                            mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                                            algorithm=hashes.SHA256(),
-                                            label=None))
+        return self._public_key.encrypt(text.encode(self._encoding), OAEP_PADDING)
 
     def _decrypt(self, value, **options):
         """
@@ -59,10 +63,7 @@ class RSA256Encrypter(RSAEncrypterBase):
         :rtype: str
         """
 
-        return self._private_key.decrypt(value, padding.OAEP(
-            mgf=padding.MGF1(algorithm=hashes.SHA256()),
-            algorithm=hashes.SHA256(),
-            label=None)).decode(self._encoding)
+        return self._private_key.decrypt(value, OAEP_PADDING).decode(self._encoding)
 
     def generate_key(self, **options):
         """
@@ -4,6 +4,7 @@ pbkdf2 hashing handler module.
 """
 
 import hashlib
+import hmac
 import re
 
 import pyrin.configuration.services as config_services
@@ -109,7 +110,8 @@ class PBKDF2Hashing(HashingBase):
                                                     internal_algorithm=internal_algorithm,
                                                     rounds=rounds, salt=salt)
 
-        return hashed_value == new_full_hashed_value
+        # comparison is done in constant time to prevent timing attacks.
+        return hmac.compare_digest(hashed_value, new_full_hashed_value)
 
     def _get_algorithm(self, **options):
         """
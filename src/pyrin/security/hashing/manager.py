@@ -57,13 +57,14 @@ class HashingManager(Manager):
                                                  .format(instance=instance,
                                                          base=AbstractHashingBase))
 
-        if instance.get_name() is None or len(instance.get_name().strip()) == 0:
+        name = instance.get_name()
+        if name is None or len(name.strip()) == 0:
             raise InvalidHashingHandlerNameError('Hashing handler [{instance}] '
                                                  'does not have a valid name.'
                                                  .format(instance=instance))
 
         # checking whether is there any registered instance with the same name.
-        if instance.get_name() in self._hashing_handlers:
+        if name in self._hashing_handlers:
             replace = options.get('replace', False)
 
             if replace is not True:
@@ -71,16 +72,16 @@ class HashingManager(Manager):
                                                     'handler with name [{name}] but "replace" '
                                                     'option is not set, so handler '
                                                     '[{instance}] could not be registered.'
-                                                    .format(name=instance.get_name(),
+                                                    .format(name=name,
                                                             instance=instance))
 
-            old_instance = self._hashing_handlers[instance.get_name()]
+            old_instance = self._hashing_handlers[name]
             print_warning('Hashing handler [{old_instance}] is going '
                           'to be replaced by [{new_instance}].'
                           .format(old_instance=old_instance, new_instance=instance))
 
         # registering new hashing handler.
-        self._hashing_handlers[instance.get_name()] = instance
+        self._hashing_handlers[name] = instance
 
     def generate_hash(self, text, **options):
         """
@@ -145,12 +146,16 @@ class HashingManager(Manager):
         :rtype: AbstractHashingBase
         """
 
-        handler_name = options.get('handler_name', self._get_default_handler_name())
-        if handler_name not in self._hashing_handlers.keys():
+        handler_name = options.get('handler_name')
+        if handler_name is None:
+            handler_name = self._get_default_handler_name()
+
+        handler = self._hashing_handlers.get(handler_name)
+        if handler is None:
             raise HashingHandlerNotFoundError('Hashing handler [{name}] not found.'
                                               .format(name=handler_name))
 
-        return self._hashing_handlers[handler_name]
+        return handler
 
     def _get_default_handler_name(self):
         """
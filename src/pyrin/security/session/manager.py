@@ -74,7 +74,9 @@ class SessionManager(Manager):
         :rtype: pyrin.processor.request.wrappers.base.CoreRequest
         """
 
-        return request
+        # the actual request object is returned instead of the proxy, so callers
+        # which access multiple attributes do not resolve the proxy for each one.
+        return request._get_current_object()
 
     def get_current_request_id(self):
         """
@@ -4,6 +4,7 @@ rs256 token handler module.
 """
 
 import pyrin.configuration.services as config_services
+import pyrin.security.utils.services as security_utils_services
 
 from pyrin.security.token.decorators import token
 from pyrin.security.token.handlers.base import RSTokenBase
@@ -26,7 +27,7 @@ class RS256Token(RSTokenBase):
         """
         gets the signing key for encoding.
 
-        :rtype: str
+        :rtype: RSAPrivateKey
         """
 
         return self._private_key
@@ -35,7 +36,7 @@ class RS256Token(RSTokenBase):
         """
         gets the signing key for decoding.
 
-        :rtype: str
+        :rtype: RSAPublicKey
         """
 
         return self._public_key
@@ -74,5 +75,11 @@ class RS256Token(RSTokenBase):
         loads public/private keys into this class's relevant attributes.
         """
 
-        self._public_key = config_services.get('security', 'token', 'rs256_public_key')
-        self._private_key = config_services.get('security', 'token', 'rs256_private_key')
+        public_pem = config_services.get('security', 'token', 'rs256_public_key')
+        private_pem = config_services.get('security', 'token', 'rs256_private_key')
+
+        # keys are loaded into key objects once, so they are
+        # not parsed again on each token encoding or decoding.
+        self._public_key, self._private_key = security_utils_services.load_rsa_key(public_pem,
+                                                                                   private_pem,
+                                                                                   **options)
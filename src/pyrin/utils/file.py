@@ -33,14 +33,7 @@ def replace_file_values_regex(source, data):
 
     path_utils.assert_exists(source)
     if data is not None and len(data) > 0:
-        with open(source, 'r') as file:
-            file_data = file.read()
-
-        for regex, value in data.items():
-            file_data = re.sub(regex, value, file_data, flags=re.MULTILINE)
-
-        with open(source, 'w') as file:
-            file.write(file_data)
+        _replace_file_values_regex(source, _compile_regex_values(data))
 
 
 def replace_files_values_regex(source, data, *patterns):
@@ -76,11 +69,54 @@ def replace_files_values_regex(source, data, *patterns):
         raise IsNotDirectoryError('Provided path [{source}] is not a directory.'
                                   .format(source=source))
 
-    for path, directories, files in os.walk(source, followlinks=True):
-        for name in files:
-            if is_match(name, *patterns):
-                file_path = os.path.abspath(os.path.join(path, name))
-                replace_file_values_regex(file_path, data)
+    if data is None or len(data) <= 0:
+        return
+
+    # regular expressions are compiled once and reused for all files.
+    replacements = _compile_regex_values(data)
+    # matching files are just discovered by walking the directory,
+    # so their existence is not asserted again.
+    for file_path in _get_matching_files(source, *patterns):
+        _replace_file_values_regex(file_path, replacements)
+
+
+def _compile_regex_values(data):
+    """
+    compiles the regular expressions of given dict.
+
+    :param dict[str, str] data: a dict containing regular expressions as keys
+                                and the values that should replace them.
+
+    :returns: list[tuple[Pattern regex, str value]]
+    :rtype: list[tuple[Pattern, str]]
+    """
+
+    return [(re.compile(regex, flags=re.MULTILINE), value)
+            for regex, value in data.items()]
+
+
+def _replace_file_values_regex(source, replacements):
+    """
+    replaces the values in given file using given compiled regular expressions.
+
+    :param str source: file path to replace its values.
+
+    :param list[tuple[Pattern, str]] replacements: compiled regular expressions
+                                                   and the values that should
+                                                   replace them.
+    """
+
+    with open(source, 'r') as file:
+        file_data = file.read()
+
+    result = file_data
+    for regex, value in replacements:
+        result = regex.sub(value, result)
+
+    # files without any matches are not rewritten.
+    if result != file_data:
+        with open(source, 'w') as file:
+            file.write(result)
 
 
 def replace_file_values(source, data):
@@ -101,14 +137,29 @@ def replace_file_values(source, data):
     """
 
     path_utils.assert_exists(source)
+    _replace_file_values(source, data)
+
+
+def _replace_file_values(source, data):
+    """
+    replaces the values in given file with values available in given dict.
+
+    it does not check that the file exists.
+
+    :param str source: file path to replace its values.
+
+    :param dict[str, str] data: a dict containing all values that
+                                must be replaced in given file.
+    """
+
     if data is not None and len(data) > 0:
         with open(source, 'r') as file:
             file_data = file.read()
 
-        file_data = file_data.format(**data)
-
-        with open(source, 'w') as file:
-            file.write(file_data)
+        result = file_data.format(**data)
+        if result != file_data:
+            with open(source, 'w') as file:
+                file.write(result)
 
 
 def replace_files_values(source, data, *patterns):
@@ -141,11 +192,13 @@ def replace_files_values(source, data, *patterns):
         raise IsNotDirectoryError('Provided path [{source}] is not a directory.'
                                   .format(source=source))
 
-    for path, directories, files in os.walk(source, followlinks=True):
-        for name in files:
-            if is_match(name, *patterns):
-                file_path = os.path.abspath(os.path.join(path, name))
-                replace_file_values(file_path, data)
+    if data is None or len(data) <= 0:
+        return
+
+    # matching files are just discovered by walking the directory,
+    # so their existence is not asserted again.
+    for file_path in _get_matching_files(source, *patterns):
+        _replace_file_values(file_path, data)
 
 
 def is_match(source, *patterns):
@@ -166,3 +219,27 @@ def is_match(source, *patterns):
 
     patterns = tuple(item.lower() for item in patterns)
     return source.lower().endswith(patterns)
+
+
+def _get_matching_files(source, *patterns):
+    """
+    gets the path of all files in given directory that match any of given patterns.
+
+    the operation will also include all files of all subdirectories.
+
+    :param str source: directory path to get its files.
+
+    :param str patterns: file name end patterns. for example it could
+                         be `'.py', '.html'`. it will match all file
+                         names if no pattern is provided.
+
+    :rtype: generator[str]
+    """
+
+    # patterns are lowered once for all files. given source is already
+    # absolute, so the joined paths are absolute too.
+    patterns = tuple(item.lower() for item in patterns)
+    for path, directories, files in os.walk(source, followlinks=True):
+        for name in files:
+            if len(patterns) <= 0 or name.lower().endswith(patterns):
+                yield os.path.join(path, name)
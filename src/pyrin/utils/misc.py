@@ -3,8 +3,6 @@
 utils misc module.
 """
 
-import inspect
-
 from pyrin.core.globals import LIST_TYPES
 from pyrin.core.exceptions import CoreAttributeError
 
@@ -145,8 +143,8 @@ def is_subclass_or_instance(value, type_):
     :rtype: bool
     """
 
-    is_subclass = inspect.isclass(value) and issubclass(value, type_)
-    return is_subclass or isinstance(value, type_)
+    return isinstance(value, type_) or \
+        (isinstance(value, type) and issubclass(value, type_))
 
 
 def get_duplicates(items):
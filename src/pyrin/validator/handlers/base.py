@@ -759,6 +759,56 @@ class ValidatorBase(AbstractValidatorBase):
 
         return cls._get_value(cls.default_fixer, value)
 
+    @classmethod
+    def _get_lookup_set(cls, values):
+        """
+        gets a frozenset of given values to be used for fast membership checks.
+
+        only immutable containers (tuple and frozenset) get a lookup set. it
+        returns None for mutable containers such as lists, because they could
+        change after the lookup set is created, so they will always be checked
+        with a linear scan. it also returns None if any of the values is not hashable.
+
+        :param list | tuple | set | frozenset values: values to get their lookup set.
+
+        :rtype: frozenset
+        """
+
+        if isinstance(values, frozenset):
+            return values
+
+        if not isinstance(values, tuple):
+            return None
+
+        try:
+            return frozenset(values)
+        except TypeError:
+            return None
+
+    @classmethod
+    def _contains(cls, values, lookup, value):
+        """
+        gets a value indicating that given value is available in given values.
+
+        it uses the given lookup set if available, and falls back to
+        the given values if the lookup set is not available or the
+        value is not hashable.
+
+        :param list | tuple | set values: values to check given value in them.
+        :param frozenset lookup: lookup set of given values. it could be None.
+        :param object value: value to be checked.
+
+        :rtype: bool
+        """
+
+        if lookup is not None:
+            try:
+                return value in lookup
+            except TypeError:
+                pass
+
+        return value in values
+
     @classmethod
     def _get_value(cls, value, *args):
         """
@@ -816,7 +816,13 @@ class InValidator(ValidatorBase):
         self._instance_valid_values = None
         if self.default_valid_values is None \
                 and self.field is not None and self.field.check_in is not None:
-            self._instance_valid_values = self.field.check_in
+            # column check values are normalized to a tuple to be able to use a
+            # lookup set for them. they do not change after the column is created.
+            valid_values = self.field.check_in
+            if isinstance(valid_values, list):
+                valid_values = tuple(valid_values)
+
+            self._instance_valid_values = valid_values
 
         if not callable(self.valid_values_provider) and \
                 (self.valid_values_provider is None or
@@ -826,6 +832,8 @@ class InValidator(ValidatorBase):
                                                  'be provided as iterable or callable.'
                                                  .format(name=self))
 
+        # a tuple of the latest checked valid values and their lookup set.
+        self._valid_values_lookup = (None, None)
         self._validate_exception_type(self.not_in_value_error)
 
     def _validate(self, value, **options):
@@ -849,7 +857,8 @@ class InValidator(ValidatorBase):
         super()._validate(value, **options)
 
         current_valid = self.valid_values
-        if value not in current_valid:
+        lookup = self._get_valid_values_lookup(current_valid)
+        if not self._contains(current_valid, lookup, value):
             raise self.not_in_value_error(self.not_in_value_message.format(
                 param_name=self._get_field_name(**options),
                 values=self._get_list_representation(current_valid)))
@@ -877,6 +886,26 @@ class InValidator(ValidatorBase):
 
         return info
 
+    def _get_valid_values_lookup(self, values):
+        """
+        gets the lookup set of given valid values.
+
+        the lookup set is created from the same values that are checked and
+        it is reused as long as the same values object is given. it returns
+        None for values which could not have a lookup set, such as lists.
+
+        :param list | tuple | set | frozenset values: valid values.
+
+        :rtype: frozenset
+        """
+
+        source, lookup = self._valid_values_lookup
+        if source is not values:
+            lookup = self._get_lookup_set(values)
+            self._valid_values_lookup = (values, lookup)
+
+        return lookup
+
     @property
     def valid_values(self):
         """
@@ -1029,7 +1058,13 @@ class NotInValidator(ValidatorBase):
         self._instance_invalid_values = None
         if self.default_invalid_values is None \
                 and self.field is not None and self.field.check_not_in is not None:
-            self._instance_invalid_values = self.field.check_not_in
+            # column check values are normalized to a tuple to be able to use a
+            # lookup set for them. they do not change after the column is created.
+            invalid_values = self.field.check_not_in
+            if isinstance(invalid_values, list):
+                invalid_values = tuple(invalid_values)
+
+            self._instance_invalid_values = invalid_values
 
         if not callable(self.invalid_values_provider) and \
                 (self.invalid_values_provider is None or
@@ -1039,6 +1074,8 @@ class NotInValidator(ValidatorBase):
                                                    'must be provided as iterable or callable.'
                                                    .format(name=self))
 
+        # a tuple of the latest checked invalid values and their lookup set.
+        self._invalid_values_lookup = (None, None)
         self._validate_exception_type(self.in_value_error)
 
     def _validate(self, value, **options):
@@ -1062,7 +1099,8 @@ class NotInValidator(ValidatorBase):
         super()._validate(value, **options)
 
         current_invalid = self.invalid_values
-        if value in current_invalid:
+        lookup = self._get_invalid_values_lookup(current_invalid)
+        if self._contains(current_invalid, lookup, value):
             raise self.in_value_error(self.in_value_message.format(
                 param_name=self._get_field_name(**options),
                 values=self._get_list_representation(current_invalid)))
@@ -1090,6 +1128,26 @@ class NotInValidator(ValidatorBase):
 
         return info
 
+    def _get_invalid_values_lookup(self, values):
+        """
+        gets the lookup set of given invalid values.
+
+        the lookup set is created from the same values that are checked and
+        it is reused as long as the same values object is given. it returns
+        None for values which could not have a lookup set, such as lists.
+
+        :param list | tuple | set | frozenset values: invalid values.
+
+        :rtype: frozenset
+        """
+
+        source, lookup = self._invalid_values_lookup
+        if source is not values:
+            lookup = self._get_lookup_set(values)
+            self._invalid_values_lookup = (values, lookup)
+
+        return lookup
+
     @property
     def invalid_values(self):
         """
@@ -313,6 +313,29 @@ class ValidatorManager(Manager):
         """
 
         validator = self.get_validator(domain, name, **options)
+        return self._validate_field(validator, domain, name, value, **options)
+
+    def _validate_field(self, validator, domain, name, value, **options):
+        """
+        validates the given value with given validator.
+
+        :param AbstractValidatorBase validator: validator to be used.
+                                                it could be None.
+
+        :param type[BaseEntity] | str domain: the domain of given validator.
+        :param InstrumentedAttribute | str name: name of given validator.
+        :param object value: value to be validated.
+
+        :keyword bool force: specifies that if there is no validator
+                             with given name, it should raise an error.
+                             defaults to False if not provided.
+
+        :raises ValidatorNotFoundError: validator not found error.
+        :raises ValidationError: validation error.
+
+        :returns: same value or fixed one.
+        """
+
         force = options.get('force')
         if force is None:
             force = False
@@ -433,7 +456,10 @@ class ValidatorManager(Manager):
                         and name not in data:
                     continue
 
-                fixed_value = self.validate_field(domain, name, data.get(name), **options)
+                # validators are taken from the already fetched domain validators
+                # to prevent fetching the domain validators again for each field.
+                fixed_value = self._validate_field(available_validators.get(name),
+                                                   domain, name, data.get(name), **options)
                 if fixed_value is not None:
                     data[name] = fixed_value
                     if entity is not None:
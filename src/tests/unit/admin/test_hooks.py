@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+admin test_hooks module.
+"""
+
+import pyrin.admin.api as admin_api
+import pyrin.application.services as application_services
+
+from pyrin.admin.hooks import ApplicationHook
+
+
+def test_admin_route_registered():
+    """
+    gets the rules of application after it has been initialized.
+    it should contain the admin routes.
+    """
+
+    app = application_services.get_current_app()
+    rules = set(rule.rule for rule in app.url_map.iter_rules())
+
+    assert '/admin/api/<register_name>/' in rules
+
+
+def test_admin_route_not_registered_in_scripting_mode(monkeypatch):
+    """
+    calls the application initialized hook in scripting mode.
+    it should not register the admin routes.
+    """
+
+    calls = []
+    monkeypatch.setattr(application_services, 'is_scripting_mode', lambda: True)
+    monkeypatch.setattr(admin_api, 'register_routes', lambda: calls.append(True))
+
+    ApplicationHook().application_initialized()
+
+    assert len(calls) == 0
+
+
+def test_admin_route_registered_in_normal_mode(monkeypatch):
+    """
+    calls the application initialized hook in normal mode.
+    it should register the admin routes.
+    """
+
+    calls = []
+    monkeypatch.setattr(application_services, 'is_scripting_mode', lambda: False)
+    monkeypatch.setattr(admin_api, 'register_routes', lambda: calls.append(True))
+
+    ApplicationHook().application_initialized()
+
+    assert len(calls) == 1
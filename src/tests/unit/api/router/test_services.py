@@ -8,8 +8,9 @@ import pytest
 import pyrin.api.router.services as router_services
 
 from pyrin.api.router.exceptions import RouteAuthenticationMismatchError
-from pyrin.api.router.handlers.protected import FreshProtectedRoute, ProtectedRoute
-from pyrin.api.router.handlers.public import PublicRoute
+from pyrin.api.router.handlers.protected import FreshProtectedRoute, ProtectedRoute, \
+    FreshProtectedTemporaryRoute
+from pyrin.api.router.handlers.public import PublicRoute, PublicTemporaryRoute
 from pyrin.api.schema.structs import ResultSchema
 from pyrin.application.exceptions import DuplicateRouteURLError
 from pyrin.core.enumerations import HTTPMethodEnum
@@ -54,6 +55,36 @@ def test_create_route_public():
     assert isinstance(route, PublicRoute)
 
 
+def test_create_route_public_temporary():
+    """
+    creates the appropriate route based on the input parameters.
+    it should create a public temporary route.
+    """
+
+    route = router_services.create_route('/api/router/public_temporary',
+                                         methods=HTTPMethodEnum.GET,
+                                         view_function=mock_view_function,
+                                         request_limit=10)
+
+    assert isinstance(route, PublicTemporaryRoute)
+
+
+def test_create_route_fresh_protected_temporary():
+    """
+    creates the appropriate route based on the input parameters.
+    it should create a fresh protected temporary route.
+    """
+
+    route = router_services.create_route('/api/router/fresh_protected_temporary',
+                                         methods=HTTPMethodEnum.GET,
+                                         view_function=mock_view_function,
+                                         fresh_auth=True,
+                                         authenticated=True,
+                                         lifetime=60)
+
+    assert isinstance(route, FreshProtectedTemporaryRoute)
+
+
 def test_create_route_protected_with_permissions():
     """
     creates the appropriate route based on the input parameters.
@@ -126,6 +157,34 @@ def test_create_route_with_mismatch_authentication():
                                              max_content_length=15000)
 
 
+def test_create_route_with_non_bool_authentication():
+    """
+    creates the appropriate route based on the input parameters.
+    it should raise an error due to authentication option not being a bool.
+    """
+
+    with pytest.raises(RouteAuthenticationMismatchError):
+        route = router_services.create_route('/api/router/non_bool_protected',
+                                             methods=HTTPMethodEnum.GET,
+                                             view_function=mock_view_function,
+                                             authenticated=1,
+                                             max_content_length=15000)
+
+
+def test_create_route_with_unhashable_authentication():
+    """
+    creates the appropriate route based on the input parameters.
+    it should raise an error due to authentication option being unhashable.
+    """
+
+    with pytest.raises(RouteAuthenticationMismatchError):
+        route = router_services.create_route('/api/router/unhashable_protected',
+                                             methods=HTTPMethodEnum.GET,
+                                             view_function=mock_view_function,
+                                             authenticated=[],
+                                             max_content_length=15000)
+
+
 def test_create_route_with_invalid_max_content_length():
     """
     creates the appropriate route based on the input parameters.
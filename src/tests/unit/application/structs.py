@@ -61,6 +61,13 @@ class ExtraDatabaseComponentMock(Component, Manager):
     pass
 
 
+class LateDatabaseComponentMock(Component, Manager):
+    """
+    late database component mock class.
+    """
+    pass
+
+
 class DuplicateExtraDatabaseComponentMock(Component, Manager):
     """
     duplicate extra database component mock class.
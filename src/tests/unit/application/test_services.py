@@ -28,7 +28,8 @@ from tests.unit.application.structs import ComponentMock, DatabaseComponentMock,
     DuplicateComponentMock, DuplicateComponentForReplaceMock, \
     ExtraDuplicateComponentForReplaceMock, ComponentWithCustomAttributesMock, \
     DuplicateComponentWithCustomAttributesMock, OnlyComponentMock, ApplicationMock, \
-    ComponentWithInvalidCustomKeyMock, DuplicateComponentWithInvalidCustomKeyMock
+    ComponentWithInvalidCustomKeyMock, DuplicateComponentWithInvalidCustomKeyMock, \
+    LateDatabaseComponentMock
 
 
 def test_add_context():
@@ -157,6 +158,30 @@ def test_register_component_with_custom_key_duplicate_with_replace():
     application_services.remove_component(custom_component2.get_id())
 
 
+def test_register_component_with_custom_key_after_resolve():
+    """
+    registers given application component with custom key after its
+    name has been resolved to the default component with the same custom key.
+    it should return the new custom component.
+    """
+
+    default_database_component = application_services.get_component('database.component')
+    assert application_services.get_component('database.component',
+                                              component_custom_key=3000) \
+        == default_database_component
+
+    custom_component = LateDatabaseComponentMock('database.component',
+                                                 component_custom_key=3000)
+    application_services.register_component(custom_component)
+    assert application_services.get_component('database.component',
+                                              component_custom_key=3000) == custom_component
+
+    application_services.remove_component(custom_component.get_id())
+    assert application_services.get_component('database.component',
+                                              component_custom_key=3000) \
+        == default_database_component
+
+
 def test_register_component_with_invalid_type():
     """
     registers given application component with invalid type.
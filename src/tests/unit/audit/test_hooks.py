@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+audit test_hooks module.
+"""
+
+import pyrin.audit.api as audit_api
+import pyrin.application.services as application_services
+
+from pyrin.audit.hooks import ApplicationHook
+
+
+def test_audit_route_registered():
+    """
+    gets the rules of application after it has been initialized.
+    it should contain the audit route.
+    """
+
+    app = application_services.get_current_app()
+    rules = set(rule.rule for rule in app.url_map.iter_rules())
+
+    assert '/audit/' in rules
+
+
+def test_audit_route_not_registered_in_scripting_mode(monkeypatch):
+    """
+    calls the application initialized hook in scripting mode.
+    it should not register the audit routes.
+    """
+
+    calls = []
+    monkeypatch.setattr(application_services, 'is_scripting_mode', lambda: True)
+    monkeypatch.setattr(audit_api, 'register_routes', lambda: calls.append(True))
+
+    ApplicationHook().application_initialized()
+
+    assert len(calls) == 0
+
+
+def test_audit_route_registered_in_normal_mode(monkeypatch):
+    """
+    calls the application initialized hook in normal mode.
+    it should register the audit routes.
+    """
+
+    calls = []
+    monkeypatch.setattr(application_services, 'is_scripting_mode', lambda: False)
+    monkeypatch.setattr(audit_api, 'register_routes', lambda: calls.append(True))
+
+    ApplicationHook().application_initialized()
+
+    assert len(calls) == 1
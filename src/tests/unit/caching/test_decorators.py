@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+caching test_decorators module.
+"""
+
+import pytest
+
+from pyrin.caching.decorators import cached_property
+from pyrin.caching.exceptions import CachedPropertyNameConflictError
+
+
+class CachedPropertyMock:
+    """
+    cached property mock class.
+    """
+
+    def __init__(self):
+        """
+        initializes an instance of CachedPropertyMock.
+        """
+
+        self.calls = 0
+
+    @cached_property
+    def value(self):
+        """
+        gets the value and counts its calls.
+
+        :rtype: int
+        """
+
+        self.calls += 1
+        return self.calls * 10
+
+
+def test_cached_property():
+    """
+    gets a cached property multiple times.
+    it should be calculated only once per instance.
+    """
+
+    first = CachedPropertyMock()
+    second = CachedPropertyMock()
+
+    assert first.value == 10
+    assert first.value == 10
+    assert first.calls == 1
+    assert first.__dict__['value'] == 10
+    assert second.value == 10
+    assert second.calls == 1
+
+
+def test_cached_property_set_and_delete():
+    """
+    sets and deletes a cached property.
+    setting should replace the cached value and deleting should clear it.
+    """
+
+    instance = CachedPropertyMock()
+    instance.value = 5
+
+    assert instance.value == 5
+    assert instance.calls == 0
+
+    del instance.value
+
+    assert instance.value == 10
+    assert instance.calls == 1
+
+
+def test_cached_property_assigned_name():
+    """
+    gets a cached property which is assigned to a name other than its method name.
+    it should be cached under the assigned name.
+    """
+
+    def get_value(instance):
+        """
+        gets the value.
+
+        :rtype: int
+        """
+
+        return 20
+
+    class AssignedMock:
+        """
+        assigned mock class.
+        """
+
+        value = cached_property(get_value)
+
+    instance = AssignedMock()
+
+    assert instance.value == 20
+    assert instance.__dict__ == dict(value=20)
+
+
+def test_cached_property_custom_name_and_doc():
+    """
+    gets a cached property which has a custom name and doc.
+    it should be cached under the custom name.
+    """
+
+    class CustomNameMock:
+        """
+        custom name mock class.
+        """
+
+        value = cached_property(lambda instance: 30, name='custom', doc='custom doc.')
+
+    instance = CustomNameMock()
+
+    assert CustomNameMock.value.__doc__ == 'custom doc.'
+    assert instance.value == 30
+    assert instance.__dict__ == dict(custom=30)
+
+
+def test_cached_property_with_two_names():
+    """
+    assigns a cached property to two different names.
+    it should raise an error.
+    """
+
+    class FirstMock:
+        """
+        first mock class.
+        """
+
+        pass
+
+    prop = cached_property(lambda instance: 40)
+    prop.__set_name__(FirstMock, 'first')
+
+    with pytest.raises(CachedPropertyNameConflictError):
+        prop.__set_name__(FirstMock, 'second')
@@ -165,3 +165,15 @@ class ChildEntity(CoreEntity):
     parent_id = CoreColumn(ForeignKey('parent_table.id'),
                            name='parent_id', type_=Integer, index=True)
     parent = relationship('ParentEntity', back_populates='children', uselist=False)
+
+
+class SampleWithCheckValuesEntity(CoreEntity):
+    """
+    sample with check values entity class.
+    """
+
+    _table = 'sample_with_check_values_table'
+
+    id = CoreColumn(name='id', type_=Integer, primary_key=True, autoincrement=False)
+    grade = CoreColumn(name='grade', type_=Unicode, check_in=['A', 'B'])
+    rank = CoreColumn(name='rank', type_=Integer, check_not_in=[0])
@@ -20,6 +20,17 @@ def test_values():
     assert values == set(enum_values)
 
 
+def test_values_set():
+    """
+    gets a frozenset of all available values of given enumeration.
+    """
+
+    enum_values = HTTPMethodEnum.values_set()
+
+    assert isinstance(enum_values, frozenset)
+    assert enum_values == frozenset(HTTPMethodEnum.values())
+
+
 def test_contains():
     """
     checks that given value is existed in the enumeration.
@@ -44,3 +55,4 @@ def test_in():
     assert 'unlink' not in HTTPMethodEnum
     assert 'COPY2' not in HTTPMethodEnum
     assert 400 not in RedirectionResponseCodeEnum
+    assert ['GET'] not in HTTPMethodEnum
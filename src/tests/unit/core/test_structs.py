@@ -3,7 +3,10 @@
 core test_structs module.
 """
 
-from pyrin.core.structs import Manager, Hook, CLI
+import pytest
+
+from pyrin.core.structs import Manager, Hook, CLI, DTO
+from pyrin.core.exceptions import CoreKeyError, CoreAttributeError
 
 
 def test_manager_is_singleton():
@@ -37,3 +40,30 @@ def test_cli_is_singleton():
     cli2 = CLI()
 
     assert cli1 == cli2
+
+
+def test_dto_item_and_attribute_access():
+    """
+    tests that dto values could be accessed both as items and attributes.
+    """
+
+    dto = DTO(name='pyrin', version=None)
+
+    assert dto['name'] == 'pyrin'
+    assert dto.name == 'pyrin'
+    assert dto['version'] is None
+    assert dto.version is None
+
+
+def test_dto_missing_key():
+    """
+    tests that accessing a missing key of dto raises an error.
+    """
+
+    dto = DTO(name='pyrin')
+
+    with pytest.raises(CoreKeyError):
+        dto['missing']
+
+    with pytest.raises(CoreAttributeError):
+        dto.missing
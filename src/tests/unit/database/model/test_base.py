@@ -5,7 +5,7 @@ model test_services module.
 
 import pytest
 
-from sqlalchemy import Integer, Unicode
+from sqlalchemy import Integer, Unicode, inspect
 
 from pyrin.core.globals import SECURE_TRUE, SECURE_FALSE
 from pyrin.core.structs import DTO
@@ -108,6 +108,31 @@ def test_readable_columns():
     assert set(fields4) == set(entity4.readable_columns)
 
 
+def test_writable_columns():
+    """
+    gets writable and not writable column names of entity.
+    writable columns are those that have `allow_write=True`
+    """
+
+    assert set(SampleWithHiddenFieldEntity.writable_columns) == {'age', 'name'}
+    assert set(SampleWithHiddenFieldEntity.not_writable_columns) == {'hidden_field'}
+    assert set(BaseEntity.writable_columns) == set()
+    assert set(SubBaseEntity.writable_columns) == {'age'}
+
+
+def test_foreign_key_columns():
+    """
+    gets foreign key column names of entity.
+    foreign keys must not be included in columns.
+    """
+
+    assert SampleTestEntity.foreign_key_columns == ('sample_entity_id',)
+    assert SampleTestEntity.writable_foreign_key_columns == ('sample_entity_id',)
+    assert SampleTestEntity.not_readable_foreign_key_columns == ()
+    assert set(SampleTestEntity.all_columns) == {'name', 'age'}
+    assert SampleEntity.foreign_key_columns == ()
+
+
 def test_to_dict():
     """
     converts the entity into a dict and returns it.
@@ -410,3 +435,48 @@ def test_entity_without_schema_table_fullname():
 
     assert entity.table_fullname == entity.table_name
     assert entity.table_schema is None
+
+
+def test_accessible_attributes_cache_keeps_mapper_memoizations():
+    """
+    populates the accessible attributes cache of an entity.
+    it should not expire the memoized values of the entity's mapper.
+    """
+
+    if '_accessible_attributes' in SampleEntity.__dict__:
+        type.__delattr__(SampleEntity, '_accessible_attributes')
+
+    mapper = inspect(SampleEntity)
+    attrs = mapper.attrs
+    SampleEntity._get_accessible_attributes(True, False, False, False)
+
+    assert '_accessible_attributes' in SampleEntity.__dict__
+    assert mapper.__dict__.get('attrs') is attrs
+
+
+def test_column_names_cache_keeps_mapper_memoizations():
+    """
+    populates the column names cache of an entity.
+    it should not expire the memoized values of the entity's mapper.
+    """
+
+    mapper = inspect(SampleEntity)
+    attrs = mapper.attrs
+    SampleEntity._populate_column_names()
+
+    assert SampleEntity.__dict__.get('_column_names') is not None
+    assert mapper.__dict__.get('attrs') is attrs
+
+
+def test_root_base_class_cache_keeps_mapper_memoizations():
+    """
+    populates the root base class cache of an entity.
+    it should not expire the memoized values of the entity's mapper.
+    """
+
+    mapper = inspect(SampleEntity)
+    attrs = mapper.attrs
+    SampleEntity._populate_root_base_class()
+
+    assert SampleEntity.__dict__.get('_root_base_class') is SampleEntity
+    assert mapper.__dict__.get('attrs') is attrs
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+orm sql schema test_base module.
+"""
+
+import pytest
+
+from sqlalchemy import Integer, Unicode, CheckConstraint, Table, MetaData
+from sqlalchemy.exc import ArgumentError
+
+from pyrin.database.orm.sql.schema.base import CoreColumn
+from pyrin.database.orm.sql.schema.exceptions import InvalidCheckConstraintError, \
+    CheckConstraintConflictError
+
+from tests.unit.common.models import SampleTestEntity
+
+
+def get_check_constraints(column):
+    """
+    gets the sql text of all check constraints of given column.
+
+    :param CoreColumn column: column to get its check constraints.
+
+    :rtype: set[str]
+    """
+
+    return set(str(item.sqltext) for item in column.constraints
+               if isinstance(item, CheckConstraint))
+
+
+def test_range_check_constraint():
+    """
+    creates a column with min and max values.
+    it should generate a range check constraint.
+    """
+
+    column = CoreColumn(name='age', type_=Integer, min_value=1, max_value=10)
+
+    assert get_check_constraints(column) == {'age >= 1 and age <= 10'}
+
+
+def test_check_in_constraint():
+    """
+    creates a column with valid values.
+    it should generate an `in` check constraint.
+    """
+
+    column = CoreColumn(name='grade', type_=Unicode, check_in=['A', 'B'])
+
+    assert get_check_constraints(column) == {"grade in ('A', 'B')"}
+
+
+def test_check_not_in_constraint():
+    """
+    creates a column with invalid values.
+    it should generate a `not in` check constraint.
+    """
+
+    column = CoreColumn(name='grade', type_=Unicode, check_not_in=['F'])
+
+    assert get_check_constraints(column) == {"grade not in ('F')"}
+
+
+def test_callable_values_without_constraint():
+    """
+    creates a column with callable min value and valid values.
+    it should not generate any check constraints.
+    """
+
+    column = CoreColumn(name='grade', type_=Unicode,
+                        min_value=lambda: 'A', check_in=lambda: ['A', 'B'])
+
+    assert get_check_constraints(column) == set()
+
+
+def test_primary_key_without_constraint():
+    """
+    creates a primary key column with min value.
+    it should not generate any check constraints.
+    """
+
+    column = CoreColumn(name='id', type_=Unicode, primary_key=True, min_value='A')
+
+    assert get_check_constraints(column) == set()
+
+
+def test_check_in_and_check_not_in_conflict():
+    """
+    creates a column with both valid and invalid values.
+    it should raise an error.
+    """
+
+    with pytest.raises(CheckConstraintConflictError):
+        CoreColumn(name='grade', type_=Unicode, check_in=['A'], check_not_in=['F'])
+
+
+def test_invalid_check_in():
+    """
+    creates a column with empty valid values.
+    it should raise an error.
+    """
+
+    with pytest.raises(InvalidCheckConstraintError):
+        CoreColumn(name='grade', type_=Unicode, check_in=[])
+
+
+def test_fullname():
+    """
+    gets the fullname of columns.
+    it should be made up of table name and column name.
+    """
+
+    columns = SampleTestEntity.__table__.columns
+
+    assert columns.id.fullname == 'sample_test_table.id'
+    assert columns.sample_table_id.fullname == 'sample_test_table.sample_table_id'
+
+
+def test_fullname_without_table():
+    """
+    gets the fullname of a column which has no table.
+    it should only be the column name.
+    """
+
+    column = CoreColumn(name='age', type_=Integer)
+
+    assert column.fullname == 'age'
+
+
+def test_invalid_check_not_in():
+    """
+    creates a column with invalid values which are not a list.
+    it should raise an error.
+    """
+
+    with pytest.raises(InvalidCheckConstraintError):
+        CoreColumn(name='grade', type_=Unicode, check_not_in='F')
+
+
+def test_proxy_column_without_constraint():
+    """
+    gets a column from an alias of a table.
+    the proxy column should not generate any check constraints.
+    """
+
+    table = Table('proxy_test_table', MetaData(),
+                  CoreColumn(name='id', type_=Integer, primary_key=True),
+                  CoreColumn(name='age', type_=Integer, min_value=5))
+
+    alias = table.alias()
+
+    assert get_check_constraints(table.columns.age) == \
+        {'age >= 5 and age <= 2147483647'}
+    assert get_check_constraints(alias.columns.age) == set()
+
+
+def test_positional_name_and_type():
+    """
+    creates a column with positional name, type and schema items.
+    it should extract name and type and keep the remaining schema items.
+    """
+
+    column = CoreColumn('code', Unicode(10), CheckConstraint('length(code) > 2'))
+
+    assert column.name == 'code'
+    assert isinstance(column.type, Unicode)
+    assert get_check_constraints(column) == {'length(code) > 2'}
+
+
+def test_positional_and_keyword_name():
+    """
+    creates a column with both positional and keyword name.
+    it should raise an error.
+    """
+
+    with pytest.raises(ArgumentError):
+        CoreColumn('code', Unicode(10), name='code')
+
+
+def test_extract_name_and_type_from_list():
+    """
+    extracts name and type from a list of positional arguments in a custom column.
+    name and type should be removed from the list in-place.
+    """
+
+    class CustomColumn(CoreColumn):
+        def __init__(self, *args, **kwargs):
+            args = list(args)
+            name, type_ = self._extract_name_and_type(args, kwargs)
+            super().__init__(name, type_, *args, **kwargs)
+
+    column = CustomColumn('code', Unicode(10), CheckConstraint('length(code) > 2'))
+
+    assert column.name == 'code'
+    assert isinstance(column.type, Unicode)
+    assert get_check_constraints(column) == {'length(code) > 2'}
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+orm sql schema test_columns module.
+"""
+
+import pytest
+
+from sqlalchemy import Integer
+
+from pyrin.database.orm.sql.schema.columns import PKColumn, AutoPKColumn, GUIDPKColumn, \
+    FKColumn
+from pyrin.database.orm.sql.schema.exceptions import InvalidFKColumnReferenceTypeError
+
+
+def test_pk_column_ignored_options():
+    """
+    creates a pk column with options that are not applicable to pk columns.
+    it should ignore those options.
+    """
+
+    column = PKColumn(name='id', type_=AutoPKColumn.DEFAULT_TYPE, unique=True,
+                      onupdate=lambda: 1, server_onupdate='1')
+
+    assert column.primary_key is True
+    assert column.nullable is False
+    assert column.index is True
+    assert column.unique is None
+    assert column.onupdate is None
+    assert column.server_onupdate is None
+
+
+def test_auto_pk_column_ignored_options():
+    """
+    creates an auto pk column with default values.
+    it should ignore the default values.
+    """
+
+    column = AutoPKColumn(name='id', default=1, server_default='1')
+
+    assert column.primary_key is True
+    assert column.autoincrement is True
+    assert column.default is None
+    assert column.server_default is None
+
+
+def test_guid_pk_column_ignored_options():
+    """
+    creates a guid pk column with options that are not applicable to it.
+    it should ignore those options.
+    """
+
+    column = GUIDPKColumn(name='id', server_default='1', onupdate=lambda: 1)
+
+    assert column.primary_key is True
+    assert column.default is not None
+    assert column.server_default is None
+    assert column.onupdate is None
+
+
+def test_fk_column_invalid_reference():
+    """
+    creates a fk column with invalid reference type.
+    it should raise an error.
+    """
+
+    with pytest.raises(InvalidFKColumnReferenceTypeError):
+        FKColumn(name='parent_id', type_=Integer, fk=1)
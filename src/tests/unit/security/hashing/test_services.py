@@ -12,7 +12,7 @@ from pyrin.security.hashing.handlers.bcrypt import BcryptHashing
 from pyrin.security.hashing.handlers.pbkdf2 import PBKDF2Hashing
 from pyrin.security.hashing.handlers.exceptions import BcryptMaxSizeLimitError
 from pyrin.security.hashing.exceptions import DuplicatedHashingHandlerError, \
-    InvalidHashingHandlerTypeError
+    InvalidHashingHandlerTypeError, HashingHandlerNotFoundError
 
 
 def test_register_hashing_handler_duplicate():
@@ -55,6 +55,16 @@ def test_generate_hash_default():
     assert default_handler in value
 
 
+def test_generate_hash_unknown_handler():
+    """
+    gets the hash of input text using a handler that is not registered.
+    it should raise an error.
+    """
+
+    with pytest.raises(HashingHandlerNotFoundError):
+        hashing_services.generate_hash('text', handler_name='unknown_handler')
+
+
 def test_generate_hash_bcrypt():
     """
     gets the hash of input text using bcrypt handler.
@@ -115,6 +125,17 @@ def test_is_match_pbkdf2():
     assert is_match is True
 
 
+def test_is_match_pbkdf2_mismatch():
+    """
+    gets a value indicating that given texts hashes using pbkdf2 handler are match.
+    it should not be match for a different text.
+    """
+
+    value = hashing_services.generate_hash('text', handler_name='PBKDF2')
+    is_match = hashing_services.is_match('other_text', value)
+    assert is_match is False
+
+
 def test_hashing_handler_is_singleton():
     """
     tests that different types of hashing handlers are singleton.
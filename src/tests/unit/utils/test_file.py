@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+utils test_file module.
+"""
+
+import os
+
+import pyrin.utils.file as file_utils
+
+
+def write_file(path, content):
+    """
+    writes given content into given file path.
+
+    :param str path: file path.
+    :param str content: content to be written.
+    """
+
+    with open(path, 'w') as file:
+        file.write(content)
+
+
+def read_file(path):
+    """
+    reads the content of given file path.
+
+    :param str path: file path.
+
+    :rtype: str
+    """
+
+    with open(path, 'r') as file:
+        return file.read()
+
+
+def test_replace_files_values_regex(tmp_path):
+    """
+    replaces the values of matching files in a directory using regular expressions.
+    """
+
+    sub_directory = tmp_path / 'sub'
+    sub_directory.mkdir()
+    first = str(tmp_path / 'first.ini')
+    second = str(sub_directory / 'second.ini')
+    ignored = str(tmp_path / 'ignored.txt')
+    for path in (first, second, ignored):
+        write_file(path, 'name: old\nage: 10\n')
+
+    file_utils.replace_files_values_regex(str(tmp_path), {r'^name: .*$': 'name: new',
+                                                          r'^age: .*$': 'age: 20'},
+                                          '.INI')
+
+    assert read_file(first) == 'name: new\nage: 20\n'
+    assert read_file(second) == 'name: new\nage: 20\n'
+    assert read_file(ignored) == 'name: old\nage: 10\n'
+
+
+def test_replace_file_values(tmp_path):
+    """
+    replaces the values of a file using its placeholders.
+    """
+
+    path = str(tmp_path / 'template.py')
+    write_file(path, 'name = "{name}"\n')
+
+    file_utils.replace_file_values(path, dict(name='pyrin'))
+
+    assert read_file(path) == 'name = "pyrin"\n'
+
+
+def test_replace_file_values_without_change(tmp_path):
+    """
+    replaces the values of a file that has no placeholders.
+    it should not rewrite the file.
+    """
+
+    path = str(tmp_path / 'static.py')
+    write_file(path, 'name = "pyrin"\n')
+    os.utime(path, ns=(0, 0))
+
+    file_utils.replace_file_values(path, dict(name='other'))
+
+    assert read_file(path) == 'name = "pyrin"\n'
+    assert os.stat(path).st_mtime_ns == 0
+
+
+def test_replace_files_values(tmp_path):
+    """
+    replaces the values of matching files in a directory using their placeholders.
+    """
+
+    sub_directory = tmp_path / 'sub'
+    sub_directory.mkdir()
+    first = str(tmp_path / 'first.py')
+    second = str(sub_directory / 'second.py')
+    ignored = str(tmp_path / 'ignored.txt')
+    for path in (first, second, ignored):
+        write_file(path, 'name = "{name}"\n')
+
+    file_utils.replace_files_values(str(tmp_path), dict(name='pyrin'), '.py')
+
+    assert read_file(first) == 'name = "pyrin"\n'
+    assert read_file(second) == 'name = "pyrin"\n'
+    assert read_file(ignored) == 'name = "{name}"\n'
+
+
+def test_replace_files_values_without_data(tmp_path):
+    """
+    replaces the values of files in a directory with empty data.
+    it should not rewrite any file.
+    """
+
+    path = str(tmp_path / 'template.py')
+    write_file(path, 'name = "{name}"\n')
+    os.utime(path, ns=(0, 0))
+
+    file_utils.replace_files_values(str(tmp_path), {})
+
+    assert read_file(path) == 'name = "{name}"\n'
+    assert os.stat(path).st_mtime_ns == 0
@@ -116,3 +116,15 @@ def test_extract_attributes_with_unavailable_attributes():
         attributes = DTO(name='fake_name', age=23, is_valid=True)
         instance = misc_utils.set_attributes(instance, **attributes)
         misc_utils.extract_attributes(instance, *['name', 'age', 'is_valid', 'extra_attr'])
+
+
+def test_is_subclass_or_instance():
+    """
+    checks that given values are an instance or subclass of a type.
+    """
+
+    assert misc_utils.is_subclass_or_instance(DTO, dict) is True
+    assert misc_utils.is_subclass_or_instance(DTO(), dict) is True
+    assert misc_utils.is_subclass_or_instance(CoreObject, dict) is False
+    assert misc_utils.is_subclass_or_instance(CoreObject(), dict) is False
+    assert misc_utils.is_subclass_or_instance(type, type) is True
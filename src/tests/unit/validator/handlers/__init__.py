@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""
+validator handlers package.
+"""
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+validator handlers test_misc module.
+"""
+
+import pytest
+
+from pyrin.core.enumerations import CoreEnum
+from pyrin.validator.handlers.misc import InValidator, NotInValidator
+from pyrin.validator.handlers.exceptions import ValueIsOutOfRangeError
+
+from tests.unit.common.models import SampleWithCheckValuesEntity
+
+
+GRADES = ['A', 'B']
+BANNED_GRADES = ['F']
+
+
+class GradeInValidator(InValidator):
+    """
+    grade in validator class.
+    """
+
+    default_valid_values = GRADES
+
+
+class GradeNotInValidator(NotInValidator):
+    """
+    grade not in validator class.
+    """
+
+    default_invalid_values = BANNED_GRADES
+
+
+class GradeEnum(CoreEnum):
+    """
+    grade enum class.
+    """
+
+    A = 'A'
+    B = 'B'
+
+
+class TupleGradeInValidator(InValidator):
+    """
+    tuple grade in validator class.
+    """
+
+    default_valid_values = ('A', 'B')
+
+
+class EnumGradeNotInValidator(NotInValidator):
+    """
+    enum grade not in validator class.
+    """
+
+    default_invalid_values = GradeEnum.values()
+
+
+class ChangingGradeInValidator(InValidator):
+    """
+    changing grade in validator class.
+    """
+
+    default_valid_values = ('A',)
+
+    def __init__(self, domain, field, **options):
+        """
+        initializes an instance of ChangingGradeInValidator.
+        """
+
+        super().__init__(domain, field, **options)
+        self.current_values = ('A',)
+
+    @property
+    def valid_values(self):
+        """
+        gets the current valid values.
+
+        :rtype: tuple
+        """
+
+        return self.current_values
+
+
+def test_in_validator_with_changed_values():
+    """
+    validates values with an in validator whose valid values are changed after creation.
+    it should use the current valid values.
+    """
+
+    validator = GradeInValidator('grade_domain', 'grade')
+    GRADES.append('C')
+    try:
+        validator.validate('C')
+        GRADES.remove('A')
+        with pytest.raises(ValueIsOutOfRangeError):
+            validator.validate('A')
+    finally:
+        GRADES[:] = ['A', 'B']
+
+
+def test_not_in_validator_with_changed_values():
+    """
+    validates values with a not in validator whose invalid values are changed after creation.
+    it should use the current invalid values.
+    """
+
+    validator = GradeNotInValidator('grade_domain', 'grade')
+    BANNED_GRADES.append('E')
+    try:
+        with pytest.raises(ValueIsOutOfRangeError):
+            validator.validate('E')
+    finally:
+        BANNED_GRADES[:] = ['F']
+
+
+def test_in_validator_lookup_set_with_tuple_values():
+    """
+    validates values with an in validator which has tuple valid values.
+    it should use a lookup set of valid values.
+    """
+
+    validator = TupleGradeInValidator('grade_domain', 'grade')
+    validator.validate('A')
+    with pytest.raises(ValueIsOutOfRangeError):
+        validator.validate('C')
+
+    assert validator._get_valid_values_lookup(validator.valid_values) == frozenset(('A', 'B'))
+
+
+def test_not_in_validator_lookup_set_with_enum_values():
+    """
+    validates values with a not in validator which has enum invalid values.
+    it should use a lookup set of invalid values.
+    """
+
+    validator = EnumGradeNotInValidator('grade_domain', 'grade')
+    validator.validate('C')
+    with pytest.raises(ValueIsOutOfRangeError):
+        validator.validate('A')
+
+    assert validator._get_invalid_values_lookup(validator.invalid_values) == \
+        frozenset(('A', 'B'))
+
+
+def test_in_validator_lookup_set_with_list_values():
+    """
+    gets the lookup set of an in validator which has list valid values.
+    it should not have a lookup set.
+    """
+
+    validator = GradeInValidator('grade_domain', 'grade')
+
+    assert validator._get_valid_values_lookup(validator.valid_values) is None
+
+
+def test_in_validator_with_overridden_valid_values():
+    """
+    validates values with an in validator whose valid values property is overridden.
+    it should use the current valid values.
+    """
+
+    validator = ChangingGradeInValidator('grade_domain', 'grade')
+    validator.validate('A')
+    validator.current_values = ('B',)
+    validator.validate('B')
+    with pytest.raises(ValueIsOutOfRangeError):
+        validator.validate('A')
+
+
+def test_column_check_values_lookup_set():
+    """
+    gets the lookup sets of in and not in validators of columns with list check values.
+    they should have lookup sets.
+    """
+
+    in_validator = InValidator(SampleWithCheckValuesEntity,
+                               SampleWithCheckValuesEntity.grade)
+    not_in_validator = NotInValidator(SampleWithCheckValuesEntity,
+                                      SampleWithCheckValuesEntity.rank)
+
+    assert in_validator._get_valid_values_lookup(in_validator.valid_values) == \
+        frozenset(('A', 'B'))
+    assert not_in_validator._get_invalid_values_lookup(not_in_validator.invalid_values) == \
+        frozenset((0,))